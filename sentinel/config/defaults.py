@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import pickle
 
 DEFAULT_THEME_COLORS = {
     "default": (0, 255, 65),
@@ -31,6 +31,7 @@ DEFAULT_CORE_CONFIG = {
     "frigate_host": "",
     "frigate_resolution": (1920, 1080),
     "bbox_delay": 0.4,
+    "detection_buffer_max": 1024,
     "zoom_labels": ["person", "car"],
     "zoom_level": 2.5,
     "zoom_reset_time": 5,
@@ -117,6 +118,20 @@ DEFAULT_SERVICES = {
 }
 
 
+# Pickled once at import: unpickling rebuilds every nested container in C,
+# which is cheaper than walking the defaults in Python on each clone.
+_FROZEN_DEFAULTS = pickle.dumps(
+    (
+        DEFAULT_CORE_CONFIG,
+        DEFAULT_MODULES,
+        DEFAULT_SERVICES,
+        DEFAULT_PRIORITIES,
+        DEFAULT_THEME_COLORS,
+    ),
+    protocol=pickle.HIGHEST_PROTOCOL,
+)
+
+
 def clone_defaults():
     """
     Create deep copies of the module's default configuration structures.
@@ -130,10 +145,4 @@ def clone_defaults():
             theme_colors (dict): Deep copy of DEFAULT_THEME_COLORS.
     """
 
-    return (
-        deepcopy(DEFAULT_CORE_CONFIG),
-        deepcopy(DEFAULT_MODULES),
-        deepcopy(DEFAULT_SERVICES),
-        deepcopy(DEFAULT_PRIORITIES),
-        deepcopy(DEFAULT_THEME_COLORS),
-    )
+    return pickle.loads(_FROZEN_DEFAULTS)
@@ -2,22 +2,42 @@
 
 from __future__ import annotations
 
-import importlib
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Mapping, MutableMapping, Optional
-
-import yaml
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Tuple
 
 from .defaults import clone_defaults
 
 
+_SCALAR, _MAPPING, _MUTABLE_MAPPING = 0, 1, 2
+
+# Per-type classification cache so merges avoid repeated ABC ``isinstance`` checks.
+_MAPPING_KINDS: Dict[type, int] = {dict: _MUTABLE_MAPPING, type(None): _SCALAR}
+
+
+def _mapping_kind(value: Any) -> int:
+    """Classify ``value`` as a scalar, a read-only mapping or a mutable mapping."""
+    cls = type(value)
+    kind = _MAPPING_KINDS.get(cls)
+    if kind is None:
+        if isinstance(value, MutableMapping):
+            kind = _MUTABLE_MAPPING
+        elif isinstance(value, Mapping):
+            kind = _MAPPING
+        else:
+            kind = _SCALAR
+        _MAPPING_KINDS[cls] = kind
+    return kind
+
+
 def _deep_update(base: MutableMapping[str, Any], updates: Mapping[str, Any]) -> MutableMapping[str, Any]:
     """
     Recursively merge mapping values from `updates` into `base`.
     
     Nested mappings are merged into corresponding nested mutable mappings in `base`; other values overwrite `base` entries. The `base` mapping is modified in place and also returned.
+    Nesting is walked with an explicit stack rather than recursive calls.
     
     Parameters:
         base (MutableMapping[str, Any]): The mapping to update; mutated in place.
@@ -26,18 +46,132 @@ def _deep_update(base: MutableMapping[str, Any], updates: Mapping[str, Any]) ->
     Returns:
         MutableMapping[str, Any]: The same `base` mapping after applying the updates.
     """
-    for key, value in updates.items():
-        if isinstance(value, Mapping) and isinstance(base.get(key), MutableMapping):
-            _deep_update(base[key], value)  # type: ignore[index]
-        else:
-            base[key] = value
+    if not updates:
+        return base
+    kind_of = _mapping_kind
+    stack = [(base, updates)]
+    while stack:
+        target, source = stack.pop()
+        # Without shared keys nothing can nest, so a bulk C-level update is equivalent.
+        if source.keys().isdisjoint(target.keys()):
+            target.update(source)
+            continue
+        for key, value in source.items():
+            current = target.get(key)
+            # YAML-derived values are plain dicts; the pointer compare skips the kind lookup.
+            if type(value) is dict and type(current) is dict:
+                stack.append((current, value))
+            elif kind_of(value) and kind_of(current) == _MUTABLE_MAPPING:
+                stack.append((current, value))
+            else:
+                target[key] = value
     return base
 
 
+# Parsed YAML documents keyed by absolute path with the (mtime_ns, size) signature
+# they were parsed at, plus the decoder that turns the stored payload into a fresh copy.
+# A newer version of a file replaces its entry.
+_PARSED_YAML: Dict[str, Tuple[Tuple[int, int], Callable[[Any], Dict[str, Any]], Any]] = {}
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _json_exact(data: Any) -> bool:
+    """Return True when `data` survives a JSON round trip unchanged (string keys, lists and scalars only)."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        cls = type(value)
+        if cls is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            stack.extend(value.values())
+        elif cls is list:
+            stack.extend(value)
+        elif cls not in _JSON_SCALARS:
+            return False
+    return True
+
+
+def _yaml_cache_dir() -> Path:
+    """Return the on-disk directory holding cached YAML parse results."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "sentinel" / "yaml"
+
+
+def _yaml_cache_file(path: str) -> Path:
+    import hashlib
+
+    # One file per settings file, so an edit overwrites the stale entry instead of orphaning it.
+    digest = hashlib.sha1(path.encode("utf8")).hexdigest()
+    return _yaml_cache_dir() / f"{digest}.json"
+
+
+def _decode_yaml_cache(text: str) -> Dict[str, Any]:
+    """Return the document held in a cache entry, an ``[mtime_ns, size, document]`` JSON array."""
+    import json
+
+    return json.loads(text)[2]
+
+
+def _read_yaml_cache(path: str, signature: Tuple[int, int]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Return the cache entry text for `path` and its document, or None when absent, stale or unreadable."""
+    import json
+
+    try:
+        text = _yaml_cache_file(path).read_text(encoding="utf8")
+        mtime_ns, size, document = json.loads(text)
+    except (OSError, ValueError, TypeError):
+        return None
+    if (mtime_ns, size) != tuple(signature) or type(document) is not dict:
+        return None
+    return text, document
+
+
+def _write_yaml_cache(path: str, text: str) -> None:
+    """Store the cache entry `text` for `path` atomically; caching is best effort and never fails the load."""
+    import tempfile
+
+    target = _yaml_cache_file(path)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as fh:
+                fh.write(text)
+            os.replace(tmp_name, target)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def _parse_yaml(path: Path) -> Dict[str, Any]:
+    """Parse `path` with the fastest available safe loader; missing files yield an empty dict."""
+    # Imported lazily: warm starts are served from the parse cache and never need PyYAML.
+    import yaml
+
+    # Prefer libyaml's C parser when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        # One read() of raw bytes; the loader decodes UTF-8 itself instead of pulling text through a file object.
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    data = yaml.load(raw, Loader=loader) or {}
+    if type(data) is not dict and not isinstance(data, Mapping):
+        raise ValueError(f"Configuration file '{path}' must contain a mapping")
+    return dict(data)
+
+
 def _load_yaml(path: Path) -> Dict[str, Any]:
     """
     Load a YAML file and return its top-level mapping as a dictionary.
     
+    Parse results are cached per file path and reused while the file's modification time and size are unchanged: in memory for the life of the process and as JSON under ``$XDG_CACHE_HOME/sentinel/yaml`` across restarts. The on-disk cache holds plain data only, so a tampered entry can at worst yield wrong settings, never run code. Every call returns a fresh copy, so callers may mutate the result.
+    
     Parameters:
         path (Path): Path to the YAML file to load.
     
@@ -47,23 +181,85 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     Raises:
         ValueError: If the YAML document exists but is not a mapping.
     """
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
-    with path.open("r", encoding="utf8") as fh:
-        data = yaml.safe_load(fh) or {}
-    if not isinstance(data, Mapping):
-        raise ValueError(f"Configuration file '{path}' must contain a mapping")
-    return dict(data)
+    abs_path = os.path.abspath(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSED_YAML.get(abs_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1](cached[2])
+    entry = _read_yaml_cache(abs_path, signature)
+    if entry is not None:
+        text, data = entry
+        _PARSED_YAML[abs_path] = (signature, _decode_yaml_cache, text)
+        return data
+    data = _parse_yaml(path)
+    if _json_exact(data):
+        import json
+
+        text = json.dumps([signature[0], signature[1], data], separators=(",", ":"))
+        _write_yaml_cache(abs_path, text)
+        _PARSED_YAML[abs_path] = (signature, _decode_yaml_cache, text)
+    else:
+        # Dates, sets or non-string keys do not survive JSON: such files are only cached
+        # in memory, where pickling the tree is safe.
+        import pickle
+
+        _PARSED_YAML[abs_path] = (signature, pickle.loads, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    return data
+
+
+def _scan_yaml_files(directory: Path) -> List[Path]:
+    """
+    List the regular ``*.yaml`` files directly inside `directory`.
+
+    Uses a single ``os.scandir`` pass, whose entries carry the file type from the directory listing, instead of ``Path.glob``.
+    A missing directory yields an empty list, so callers need no separate ``exists()`` check.
+    """
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    with entries:
+        paths = [Path(entry.path) for entry in entries if entry.name.endswith(".yaml") and entry.is_file()]
+    # Directory order is filesystem dependent; sort so module registration order is stable.
+    paths.sort()
+    return paths
+
+
+# Below this many files a thread pool costs more than it saves.
+_PARALLEL_PARSE_THRESHOLD = 4
 
 
-@dataclass
+def _load_yaml_files(paths: List[Path]) -> List[Tuple[Path, Dict[str, Any]]]:
+    """
+    Parse every file in `paths` with :func:`_load_yaml`, preserving order.
+
+    Larger batches are spread over a thread pool so file reads and parsing overlap; the first error raised by any file propagates as it would sequentially.
+    """
+    if len(paths) < _PARALLEL_PARSE_THRESHOLD:
+        return [(path, _load_yaml(path)) for path in paths]
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(8, os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(zip(paths, pool.map(_load_yaml, paths)))
+
+
+# Settings objects live for the whole process; slots drop the per-instance __dict__ (Python 3.10+).
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ModuleSettings:
     path: str
     enabled: bool = True
     settings: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConfigurationBundle:
     core: Dict[str, Any]
     modules: Dict[str, ModuleSettings]
@@ -72,7 +268,7 @@ class ConfigurationBundle:
     theme_colors: Dict[str, Any]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ServiceSettings:
     path: str
     enabled: bool = True
@@ -112,48 +308,66 @@ def load_configuration(settings_dir: Optional[Path] = None) -> ConfigurationBund
 
     # -- load YAML files ----------------------------------------------------------
     core_yaml = settings_dir / "core.yaml"
-    if core_yaml.exists():
-        _deep_update(core_config, _load_yaml(core_yaml))
+    _deep_update(core_config, _load_yaml(core_yaml))
 
     priorities_yaml = settings_dir / "priorities.yaml"
-    if priorities_yaml.exists():
-        _deep_update(priorities_config, _load_yaml(priorities_yaml))
+    _deep_update(priorities_config, _load_yaml(priorities_yaml))
+
+    # Entries are normalised into settings objects as they are read; the bundled defaults are already well formed.
+    module_settings: Dict[str, ModuleSettings] = {
+        name: ModuleSettings(path=entry["module"], enabled=entry["enabled"], settings=entry["config"])
+        for name, entry in modules_config.items()
+    }
+    service_settings: Dict[str, ServiceSettings] = {
+        name: ServiceSettings(path=entry["service"], enabled=entry["enabled"], settings=entry["config"])
+        for name, entry in services_config.items()
+    }
 
     modules_dir = settings_dir / "modules"
-    if modules_dir.exists():
-        for module_file in modules_dir.glob("*.yaml"):
-            payload = _load_yaml(module_file)
-            name = module_file.stem
-            existing = modules_config.get(name, {})
-            module_path = payload.get("module") or payload.get("path") or existing.get("module")
-            if not module_path:
-                raise ValueError(f"Module file '{module_file}' is missing the 'module' key")
-            modules_config[name] = {
-                "module": module_path,
-                "enabled": payload.get("enabled", existing.get("enabled", True)),
-                "config": payload.get("config") or payload.get("settings") or existing.get("config", {}),
-            }
+    # File stems are unique within a directory, so entries can be collected and merged in one update.
+    new_modules: Dict[str, ModuleSettings] = {}
+    for module_file, payload in _load_yaml_files(_scan_yaml_files(modules_dir)):
+        name = module_file.stem
+        existing = module_settings.get(name)
+        module_path = payload.get("module") or payload.get("path") or (existing.path if existing else None)
+        if not module_path:
+            raise ValueError(f"Module file '{module_file}' is missing the 'module' key")
+        if not isinstance(module_path, str):
+            module_settings.pop(name, None)
+            continue
+        cfg = payload.get("config") or payload.get("settings") or (existing.settings if existing else {})
+        new_modules[name] = ModuleSettings(
+            path=module_path,
+            enabled=bool(payload.get("enabled", existing.enabled if existing else True)),
+            settings=dict(cfg),
+        )
+    module_settings.update(new_modules)
 
     services_dir = settings_dir / "services"
-    if services_dir.exists():
-        for service_file in services_dir.glob("*.yaml"):
-            payload = _load_yaml(service_file)
-            name = service_file.stem
-            existing = services_config.get(name, {})
-            service_path = payload.get("service") or payload.get("path") or existing.get("service")
-            if not service_path:
-                raise ValueError(f"Service file '{service_file}' is missing the 'service' key")
-            services_config[name] = {
-                "service": service_path,
-                "enabled": payload.get("enabled", existing.get("enabled", True)),
-                "config": payload.get("config") or payload.get("settings") or existing.get("config", {}),
-            }
+    new_services: Dict[str, ServiceSettings] = {}
+    for service_file, payload in _load_yaml_files(_scan_yaml_files(services_dir)):
+        name = service_file.stem
+        existing = service_settings.get(name)
+        service_path = payload.get("service") or payload.get("path") or (existing.path if existing else None)
+        if not service_path:
+            raise ValueError(f"Service file '{service_file}' is missing the 'service' key")
+        if not isinstance(service_path, str):
+            service_settings.pop(name, None)
+            continue
+        cfg = payload.get("config") or payload.get("settings") or (existing.settings if existing else {})
+        new_services[name] = ServiceSettings(
+            path=service_path,
+            enabled=bool(payload.get("enabled", existing.enabled if existing else True)),
+            settings=dict(cfg),
+        )
+    service_settings.update(new_services)
 
     theme_yaml = settings_dir / "theme.yaml"
-    if theme_yaml.exists():
-        _deep_update(theme_colors, _load_yaml(theme_yaml))
+    _deep_update(theme_colors, _load_yaml(theme_yaml))
 
     # -- merge user config module -------------------------------------------------
+    import importlib
+
     try:
         user_config = importlib.import_module("config")
     except ModuleNotFoundError:
@@ -177,63 +391,48 @@ def load_configuration(settings_dir: Optional[Path] = None) -> ConfigurationBund
 
         if isinstance(modules_section, Mapping):
             for name, payload in modules_section.items():
-                if not isinstance(payload, Mapping):
+                if type(payload) is not dict and not isinstance(payload, Mapping):
                     continue
                 module_path = payload.get("module") or payload.get("path")
                 if not module_path:
-                    existing = modules_config.get(name)
-                    module_path = existing.get("module") if isinstance(existing, Mapping) else None
+                    existing = module_settings.get(name)
+                    module_path = existing.path if existing else None
                 if not module_path:
                     continue
-                modules_config[name] = {
-                    "module": module_path,
-                    "enabled": payload.get("enabled", True),
-                    "config": payload.get("config") or payload.get("settings") or {},
-                }
+                if not isinstance(module_path, str):
+                    module_settings.pop(name, None)
+                    continue
+                cfg = payload.get("config") or payload.get("settings") or {}
+                module_settings[name] = ModuleSettings(
+                    path=module_path,
+                    enabled=bool(payload.get("enabled", True)),
+                    settings=dict(cfg),
+                )
 
         if isinstance(services_section, Mapping):
             for name, payload in services_section.items():
-                if not isinstance(payload, Mapping):
+                if type(payload) is not dict and not isinstance(payload, Mapping):
                     continue
                 service_path = payload.get("service") or payload.get("path")
                 if not service_path:
-                    existing = services_config.get(name)
-                    service_path = existing.get("service") if isinstance(existing, Mapping) else None
+                    existing = service_settings.get(name)
+                    service_path = existing.path if existing else None
                 if not service_path:
                     continue
-                services_config[name] = {
-                    "service": service_path,
-                    "enabled": payload.get("enabled", True),
-                    "config": payload.get("config") or payload.get("settings") or {},
-                }
+                if not isinstance(service_path, str):
+                    service_settings.pop(name, None)
+                    continue
+                cfg = payload.get("config") or payload.get("settings") or {}
+                service_settings[name] = ServiceSettings(
+                    path=service_path,
+                    enabled=bool(payload.get("enabled", True)),
+                    settings=dict(cfg),
+                )
 
         theme_section = getattr(user_config, "THEME_COLORS", None)
         if isinstance(theme_section, Mapping):
             _deep_update(theme_colors, theme_section)
 
-    # -- convert module dicts into dataclasses ------------------------------------
-    module_settings: Dict[str, ModuleSettings] = {}
-    for name, payload in modules_config.items():
-        if not isinstance(payload, Mapping):
-            continue
-        path = payload.get("module") or payload.get("path")
-        if not isinstance(path, str):
-            continue
-        enabled = bool(payload.get("enabled", True))
-        cfg = payload.get("config") or payload.get("settings") or {}
-        module_settings[name] = ModuleSettings(path=path, enabled=enabled, settings=dict(cfg))
-
-    service_settings: Dict[str, ServiceSettings] = {}
-    for name, payload in services_config.items():
-        if not isinstance(payload, Mapping):
-            continue
-        path = payload.get("service") or payload.get("path")
-        if not isinstance(path, str):
-            continue
-        enabled = bool(payload.get("enabled", True))
-        cfg = payload.get("config") or payload.get("settings") or {}
-        service_settings[name] = ServiceSettings(path=path, enabled=enabled, settings=dict(cfg))
-
     return ConfigurationBundle(
         core=core_config,
         modules=module_settings,
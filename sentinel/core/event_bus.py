@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import threading
-from collections import defaultdict
-from typing import Any, Callable, DefaultDict, List
+from typing import Any, Callable, Dict, Tuple
 
 EventHandler = Callable[[Any], None]
 
@@ -13,7 +12,11 @@ class EventBus:
     """Thread-safe event dispatcher used to decouple services and modules."""
 
     def __init__(self) -> None:
-        self._handlers: DefaultDict[str, List[EventHandler]] = defaultdict(list)
+        # Handler tuples are never mutated in place: writers swap in a new tuple
+        # under the lock, so publishers can read them without locking.
+        self._handlers: Dict[str, Tuple[EventHandler, ...]] = {}
+        # One prebuilt dispatcher per event with subscribers, rebuilt whenever its handlers change.
+        self._dispatch: Dict[str, EventHandler] = {}
         self._lock = threading.RLock()
 
     # ------------------------------------------------------------------ subscription
@@ -23,7 +26,8 @@ class EventBus:
         if not callable(handler):
             raise TypeError("event handler must be callable")
         with self._lock:
-            self._handlers[event].append(handler)
+            self._handlers[event] = self._handlers.get(event, ()) + (handler,)
+            self._rebuild_dispatch(event)
         return handler
 
     def unsubscribe(self, event: str, handler: EventHandler) -> None:
@@ -31,26 +35,41 @@ class EventBus:
 
         with self._lock:
             listeners = self._handlers.get(event)
-            if not listeners:
+            if not listeners or handler not in listeners:
                 return
-            try:
-                listeners.remove(handler)
-            except ValueError:
-                return
-            if not listeners:
+            index = listeners.index(handler)
+            remaining = listeners[:index] + listeners[index + 1 :]
+            if remaining:
+                self._handlers[event] = remaining
+            else:
                 self._handlers.pop(event, None)
+            self._rebuild_dispatch(event)
+
+    def _rebuild_dispatch(self, event: str) -> None:
+        """Replace the dispatcher for *event* with one bound to its current handlers."""
+
+        handlers = self._handlers.get(event)
+        if not handlers:
+            self._dispatch.pop(event, None)
+            return
+
+        def dispatch(payload: Any, _handlers: Tuple[EventHandler, ...] = handlers) -> None:
+            for handler in _handlers:
+                try:
+                    handler(payload)
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    print(f"Error in event handler for '{event}': {exc}")
+
+        self._dispatch[event] = dispatch
 
     # ------------------------------------------------------------------ publishing
     def publish(self, event: str, payload: Any = None) -> None:
         """Invoke all handlers registered for *event* with *payload*."""
 
-        with self._lock:
-            listeners = list(self._handlers.get(event, ()))
-        for handler in listeners:
-            try:
-                handler(payload)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                print(f"Error in event handler for '{event}': {exc}")
+        # Lock-free: a single dict lookup returns a dispatcher bound to an immutable snapshot.
+        dispatch = self._dispatch.get(event)
+        if dispatch is not None:
+            dispatch(payload)
 
 
 __all__ = ["EventBus"]
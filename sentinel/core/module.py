@@ -13,8 +13,14 @@ class ScreenModule(ABC):
     module is registered by the :class:`~sentinel.core.module_manager.ModuleManager`.
     They can emit state changes via :meth:`report_state` which are then consumed by
     the priority resolver.
+
+    The base class declares ``__slots__`` for its own runtime attributes.
+    Subclasses that do not declare ``__slots__`` themselves still get a
+    ``__dict__`` and may add attributes freely.
     """
 
+    __slots__ = ("config", "manager", "app", "name", "active")
+
     #: Human friendly identifier. It is optional but helps describing modules in
     #: configuration files. The manager will always set ``self.name`` when the
     #: module is registered.
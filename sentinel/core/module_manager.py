@@ -2,57 +2,82 @@
 
 from __future__ import annotations
 
+import heapq
 import importlib
+import math
+import sys
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 from .module import ScreenModule
 
+# States and rules are read on every frame; slots avoid the per-instance __dict__ (Python 3.10+).
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Upper bound on cached (module, state) rule matches before the cache is reset.
+_MATCHING_RULES_LIMIT = 1024
+
+# Shared read-only metadata for states reported without any.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ModuleState:
     """Represents the latest state reported by a module."""
 
     state: str
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
     weight_override: Optional[int] = None
     expires_in: Optional[float] = None
     timestamp: float = field(default_factory=time.monotonic)
+    #: Monotonic time after which the state expires; resolved once when the state is reported.
+    expires_at: float = math.inf
+    #: Set once the state has expired and is serving its grace period at a decayed weight.
+    stale: bool = False
 
-    def is_expired(self, now: float, default_timeout: float) -> bool:
+    def is_expired(self, now: float) -> bool:
         """
         Determine whether this module state is considered expired at the given time.
         
-        If the instance has `expires_in` set, that value (seconds) is used as the timeout; otherwise `default_timeout` (seconds) is used. A timeout value less than or equal to zero means the state never expires.
-        
         Parameters:
         	now (float): Current monotonic time (seconds).
-        	default_timeout (float): Fallback timeout in seconds when `expires_in` is None.
         
         Returns:
-        	True if the elapsed time since the state's `timestamp` is greater than the resolved timeout, `False` otherwise.
+        	True if `now` is past the state's `expires_at` deadline, `False` otherwise.
         """
-        timeout = self.expires_in if self.expires_in is not None else default_timeout
-        if timeout <= 0:
-            return False
-        return (now - self.timestamp) > timeout
+        return now > self.expires_at
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PriorityRule:
     """Configuration for the priority resolver."""
 
     module: str
-    states: Iterable[str]
+    states: FrozenSet[str]
     weight: int
     screen: str
+    #: Weight multiplier applied while the module's state is stale. ``None`` (the default)
+    #: disables the stale grace period: the state is dropped as soon as it expires.
+    stale_decay: Optional[float] = None
 
 
+def _intern(value: Any) -> Any:
+    """Intern `value` if it is a plain string so per-frame dict and set probes compare by identity."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=None)
 def _import_string(target: str) -> Any:
     """
     Import a module or a named attribute from a module using a colon-separated path.
     
+    Results are memoized per target string; failed imports are not cached and are retried on the next call.
+    
     Parameters:
         target (str): Import path in the form "package.module" or "package.module:attribute". If an attribute is provided after a colon, that attribute is returned; otherwise the module object is returned.
     
@@ -87,15 +112,55 @@ class ModuleManager:
             idle_cycle (Optional[Iterable[str]]): Optional ordered iterable of module names to use for idle cycling; names not present in `modules` are ignored and the cycle defaults to all registered modules when empty.
         """
         self.app = app
+        self._app_tracks_current_screen = hasattr(app, "current_screen")
         self._modules: Dict[str, ScreenModule] = {}
+        # Bound ``update`` methods of the registered modules, refreshed on (un)registration.
+        self._update_callables: Tuple[Callable[[float], None], ...] = ()
+        # One slotted ModuleState per reporting module. There are only a handful and the
+        # expiry sweep runs only once a deadline passes, so columnar arrays would not pay off.
         self._states: MutableMapping[str, ModuleState] = {}
+        # Guards the state, ranking and heap structures: modules may report state from
+        # event bus callbacks running on service threads while the main loop updates.
+        self._states_lock = threading.Lock()
         self._rules: List[PriorityRule] = []
+        # Rules grouped per module with their position in ``_rules``; ties between
+        # equal weights are broken by that position, as in a linear scan.
+        self._rules_by_module: Dict[str, Tuple[Tuple[int, PriorityRule], ...]] = {}
+        # Rules matching a (module, state) pair, filled on first report of that pair.
+        self._matching_rules: Dict[Tuple[str, str], Tuple[Tuple[int, PriorityRule], ...]] = {}
+        # Modules with at least one rule configuring ``stale_decay``; only their expired
+        # states are kept as stale, every other state is dropped when it expires.
+        self._grace_modules: FrozenSet[str] = frozenset()
+        # Best (-weight, rule index, screen) for every module whose state matches a rule.
+        self._active_weights: Dict[str, Tuple[float, int, str]] = {}
+        # Min-heap of (-weight, rule index, module, screen); entries that no longer
+        # match ``_active_weights`` are discarded lazily when they reach the top.
+        self._weight_heap: List[Tuple[float, int, str, str]] = []
+        # Last resolved screen; reused across frames until the ranked weights change.
+        self._resolved_screen: Optional[str] = None
+        self._resolution_dirty = True
         self._idle_cycle: List[str] = list(idle_cycle or [])
+        # First position of every name in ``_idle_cycle`` for constant-time lookups.
+        self._idle_position: Dict[str, int] = {}
         self._idle_index = 0
         self._idle_timer = 0.0
         self._idle_dwell = 20.0
         self._state_timeout = 15.0
+        # Optional anti-starvation aging: every second a candidate module spends losing
+        # it gains ``_age_scale`` weight, up to ``_age_cap`` seconds. Disabled by default.
+        self._age: Dict[str, float] = {}
+        self._age_scale = 0.0
+        self._age_cap = 8.0
+        # Aged winner, how long it has held the screen and the age boost it won with;
+        # aging cannot unseat it until it has held for one idle dwell period.
+        self._aged_winner: Optional[str] = None
+        self._aged_hold = 0.0
+        self._aged_boost = 0.0
+        # Earliest time a stored state can expire; the expiry scan is skipped until then.
+        self._next_expiry = math.inf
         self.current_screen: Optional[str] = None
+        # Module behind ``current_screen``, kept in step by _activate/unregister/shutdown.
+        self._current_module: Optional[ScreenModule] = None
 
         if priorities:
             self._load_priority_config(priorities)
@@ -111,6 +176,9 @@ class ModuleManager:
             if not self._idle_cycle and self._modules:
                 self._idle_cycle = list(self._modules.keys())
 
+        for index, name in enumerate(self._idle_cycle):
+            self._idle_position.setdefault(name, index)
+
     # ------------------------------------------------------------------ priorities
     def _load_priority_config(self, raw_config: Mapping[str, Any]) -> None:
         """
@@ -120,20 +188,25 @@ class ModuleManager:
         	raw_config (Mapping[str, Any]): Configuration mapping that may contain:
         		- "timeout_seconds": numeric state timeout in seconds.
         		- "idle": mapping with optional "cycle" (iterable of module names) and "dwell_seconds" (numeric).
+        		- "aging": mapping with optional "scale" (weight gained per second spent losing, 0 disables aging) and "cap" (maximum age in seconds).
         		- "rules": iterable of rule mappings; each rule may contain:
         			- "when": mapping with required "module" and optional "state" (string or iterable).
         			- "weight": value coercible to int (defaults to 0 on failure).
         			- "screen": target screen name (defaults to the module name).
+        			- "stale_decay": weight multiplier while the module's state is stale; opts the module into the stale grace period (off by default).
         		
-        	Invalid or malformed entries are ignored. Valid rules are converted to PriorityRule instances and stored in self._rules; numeric fields are normalized and states are normalized to a list of strings.
+        	Invalid or malformed entries are ignored. Valid rules are converted to PriorityRule instances and stored in self._rules; numeric fields are normalized and states are normalized to a frozenset of strings.
         """
         self._rules.clear()
+        self._rules_by_module.clear()
+        self._matching_rules.clear()
+        self._grace_modules = frozenset()
 
         timeout = raw_config.get("timeout_seconds")
         if isinstance(timeout, (int, float)):
             self._state_timeout = float(timeout)
 
-        idle_cfg = raw_config.get("idle", {}) if isinstance(raw_config, Mapping) else {}
+        idle_cfg = raw_config.get("idle") or {}
         if isinstance(idle_cfg, Mapping):
             cycle = idle_cfg.get("cycle")
             if isinstance(cycle, Iterable) and not isinstance(cycle, (str, bytes)):
@@ -144,6 +217,15 @@ class ModuleManager:
             if isinstance(dwell, (int, float)):
                 self._idle_dwell = max(0.0, float(dwell))
 
+        aging_cfg = raw_config.get("aging", {})
+        if isinstance(aging_cfg, Mapping):
+            scale = aging_cfg.get("scale")
+            if isinstance(scale, (int, float)):
+                self._age_scale = max(0.0, float(scale))
+            cap = aging_cfg.get("cap")
+            if isinstance(cap, (int, float)):
+                self._age_cap = max(0.0, float(cap))
+
         rules = raw_config.get("rules", [])
         if not isinstance(rules, Iterable):
             return
@@ -151,20 +233,41 @@ class ModuleManager:
         for raw_rule in rules:
             if not isinstance(raw_rule, Mapping):
                 continue
-            when = raw_rule.get("when", {})
-            module_name = when.get("module") if isinstance(when, Mapping) else None
+            when = raw_rule.get("when")
+            if not isinstance(when, Mapping):
+                continue
+            module_name = when.get("module")
             if not module_name:
                 continue
-            states = when.get("state", []) if isinstance(when, Mapping) else []
+            module_name = _intern(module_name)
+            states = when.get("state", [])
             if isinstance(states, str):
                 states = [states]
             weight = raw_rule.get("weight", 0)
-            screen = raw_rule.get("screen", module_name)
+            screen = _intern(raw_rule.get("screen", module_name))
             try:
                 weight_int = int(weight)
             except (TypeError, ValueError):
                 weight_int = 0
-            self._rules.append(PriorityRule(module=module_name, states=list(states), weight=weight_int, screen=screen))
+            stale_decay = raw_rule.get("stale_decay")
+            if not isinstance(stale_decay, (int, float)) or isinstance(stale_decay, bool):
+                stale_decay = None
+            self._rules.append(
+                PriorityRule(
+                    module=module_name,
+                    states=frozenset(_intern(item) for item in states),
+                    weight=weight_int,
+                    screen=screen,
+                    stale_decay=None if stale_decay is None else max(0.0, float(stale_decay)),
+                )
+            )
+
+        grouped: Dict[str, List[Tuple[int, PriorityRule]]] = {}
+        for index, rule in enumerate(self._rules):
+            grouped.setdefault(rule.module, []).append((index, rule))
+        # Frozen per module; modules without any rule have no entry and are never ranked.
+        self._rules_by_module.update((module, tuple(entries)) for module, entries in grouped.items())
+        self._grace_modules = frozenset(rule.module for rule in self._rules if rule.stale_decay is not None)
 
     # ---------------------------------------------------------------- registration
     def register(self, name: str, module: ScreenModule) -> None:
@@ -178,11 +281,13 @@ class ModuleManager:
         Raises:
             ValueError: If a module is already registered under `name`.
         """
+        name = _intern(name)
         if name in self._modules:
             raise ValueError(f"Module '{name}' already registered")
         module.bind(name=name, manager=self, app=self.app)
         module.active = False
         self._modules[name] = module
+        self._update_callables = tuple(registered.update for registered in self._modules.values())
 
     def unregister(self, name: str) -> None:
         """
@@ -196,20 +301,38 @@ class ModuleManager:
         module = self._modules.pop(name, None)
         if module is None:
             return
+        self._update_callables = tuple(registered.update for registered in self._modules.values())
         module.unbind()
-        self._states.pop(name, None)
+        self.clear_state(name)
         if self.current_screen == name:
             self.current_screen = None
+            self._current_module = None
 
     # -------------------------------------------------------------------- lifecycle
     def shutdown(self) -> None:
         """
         Unregisters and shuts down all registered screen modules.
         
-        Removes every module from the manager by calling unregister for each registered name; this unbinds modules, clears their stored state, and deactivates the current screen when applicable.
-        """
-        for name in list(self._modules.keys()):
-            self.unregister(name)
+        Unbinds every module in registration order, then drops their stored states and clears the registry and the current screen in one pass, without going through :meth:`unregister` per module. A module whose ``unbind`` raises is reported and skipped; the remaining modules are still unbound and the registry is always cleared.
+        """
+        modules = self._modules
+        try:
+            for name, module in modules.items():
+                try:
+                    module.unbind()
+                except Exception as exc:  # pragma: no cover - defensive logging
+                    print(f"Error unbinding module '{name}': {exc}")
+        finally:
+            # Cleared even if a module fails so a restart never builds on stale state.
+            with self._states_lock:
+                for name in modules:
+                    self._states.pop(name, None)
+                    self._active_weights.pop(name, None)
+                self._resolution_dirty = True
+            modules.clear()
+            self._update_callables = ()
+            self.current_screen = None
+            self._current_module = None
 
     # ---------------------------------------------------------------------- runtime
     def update(self, dt: float) -> None:
@@ -220,14 +343,22 @@ class ModuleManager:
         	dt (float): Seconds elapsed since the last update call.
         """
         now = time.monotonic()
-        expired = [name for name, state in self._states.items() if state.is_expired(now, self._state_timeout)]
-        for name in expired:
-            self._states.pop(name, None)
-
-        for module in self._modules.values():
-            module.update(dt)
-
-        target_screen = self._resolve_priority()
+        if now >= self._next_expiry:
+            with self._states_lock:
+                self._expire_states(now)
+
+        for update_module in self._update_callables:
+            update_module(dt)
+
+        if not self._active_weights:
+            target_screen = None
+        elif self._age_scale:
+            # Ages move with time, so aged results are never reused.
+            target_screen = self._resolve_aged_priority(dt)
+        elif self._resolution_dirty:
+            target_screen = self._resolve_priority()
+        else:
+            target_screen = self._resolved_screen
         if target_screen:
             if target_screen != self.current_screen:
                 self._activate(target_screen)
@@ -244,12 +375,9 @@ class ModuleManager:
         Parameters:
             surface (Any): Drawing surface passed to the active screen module's render method.
         """
-        if not self.current_screen:
-            return
-        module = self._modules.get(self.current_screen)
-        if module is None:
-            return
-        module.render(surface)
+        module = self._current_module
+        if module is not None:
+            module.render(surface)
 
     def handle_event(self, event: Any) -> None:
         """
@@ -260,39 +388,35 @@ class ModuleManager:
         Parameters:
             event (Any): Event object to deliver to the active module's handle_event method.
         """
-        if not self.current_screen:
-            return
-        module = self._modules.get(self.current_screen)
-        if module is None:
-            return
-        module.handle_event(event)
+        module = self._current_module
+        if module is not None:
+            module.handle_event(event)
 
     # --------------------------------------------------------------------- helpers
     def _activate(self, name: str) -> None:
         """
         Activate the named screen module and run its lifecycle transitions.
         
-        If the given name is not registered, this is a no-op. Deactivates any previously active screen (sets its `active` flag to False and calls its `on_hide()`), sets `current_screen` to `name`, activates the new module (sets its `active` flag to True and calls its `on_show()`), and updates the application and idle-cycle tracking as applicable: if the `app` has a `current_screen` attribute it is set to `name`, and if `name` is present in `_idle_cycle` the manager's `_idle_index` is updated to that position (lookup failures are ignored).
+        If the given name is not registered, this is a no-op. Deactivates any previously active screen (sets its `active` flag to False and calls its `on_hide()`), sets `current_screen` to `name`, activates the new module (sets its `active` flag to True and calls its `on_show()`), and updates the application and idle-cycle tracking as applicable: if the `app` had a `current_screen` attribute when the manager was created it is set to `name`, and if `name` is present in `_idle_cycle` the manager's `_idle_index` is updated to its first position there.
         Parameters:
             name (str): The registered module name to activate.
         """
-        if name not in self._modules:
+        module = self._modules.get(name)
+        if module is None:
             return
-        if self.current_screen and self.current_screen in self._modules:
-            previous = self._modules[self.current_screen]
+        previous = self._current_module
+        if previous is not None:
             previous.active = False
             previous.on_hide()
         self.current_screen = name
-        module = self._modules[name]
+        self._current_module = module
         module.active = True
         module.on_show()
-        if hasattr(self.app, "current_screen"):
+        if self._app_tracks_current_screen:
             self.app.current_screen = name
-        if name in self._idle_cycle:
-            try:
-                self._idle_index = self._idle_cycle.index(name)
-            except ValueError:
-                pass
+        position = self._idle_position.get(name)
+        if position is not None:
+            self._idle_index = position
 
     def set_active(self, name: str) -> None:
         """
@@ -315,7 +439,7 @@ class ModuleManager:
         """
         if not self._idle_cycle:
             return
-        if self.current_screen not in self._idle_cycle:
+        if self.current_screen not in self._idle_position:
             self._idle_index = 0
             self._activate(self._idle_cycle[0])
             self._idle_timer = 0.0
@@ -332,26 +456,157 @@ class ModuleManager:
         """
         Selects the screen that should be active based on configured priority rules and current module states.
         
-        Considers each PriorityRule whose module has a reported state and, if the rule specifies allowed states, only when the module's state is in that set. For each matching rule the effective weight is the module state's `weight_override` when present, otherwise the rule's `weight`. The rule with the highest effective weight determines the returned screen.
+        Each module's best matching rule is computed when its state is reported (see :meth:`_rank_state`) and pushed onto a heap. The heap top is the winning rule; entries made stale by newer reports, cleared or expired states are dropped as they surface. The result is remembered so :meth:`update` can skip resolution until the ranked weights change.
         
         Returns:
             The name of the winning screen as a `str`, or `None` if no rule matches the current states.
         """
-        best_screen = None
-        best_weight = float("-inf")
+        with self._states_lock:
+            heap = self._weight_heap
+            active = self._active_weights
+            screen = None
+            while heap:
+                neg_weight, index, module, top_screen = heap[0]
+                if active.get(module) == (neg_weight, index, top_screen):
+                    screen = top_screen
+                    break
+                heapq.heappop(heap)
+            self._resolved_screen = screen
+            self._resolution_dirty = False
+            return screen
+
+    def _resolve_aged_priority(self, dt: float) -> Optional[str]:
+        """
+        Select the winning screen with aging applied, then advance the age counters by `dt`.
+        
+        A candidate's effective weight is its ranked weight plus ``age * _age_scale``, where its age is the time in seconds it has spent losing, capped at ``_age_cap``. The winner's age is reset. Once a screen wins it keeps the boost it won with for one idle dwell period; until then the other candidates are compared by their ranked weight alone, so only a real priority change can unseat it. Ages change with time, so the heap is bypassed in favour of a pass over the candidate modules.
+        
+        Parameters:
+            dt (float): Seconds elapsed since the last update call.
+        """
+        with self._states_lock:
+            active = self._active_weights
+            ages = self._age
+            scale = self._age_scale
+            holder = self._aged_winner
+            holding = holder in active and self._aged_hold < self._idle_dwell
+            best = None
+            for module, (neg_weight, index, screen) in active.items():
+                if not holding:
+                    weight = ages.get(module, 0.0) * scale - neg_weight
+                elif module == holder:
+                    weight = self._aged_boost - neg_weight
+                else:
+                    weight = -neg_weight
+                if best is None or weight > best[0] or (weight == best[0] and index < best[1]):
+                    best = (weight, index, module, screen)
+            if best is None:
+                self._age = {}
+                self._aged_winner = None
+                return None
+            winner = best[2]
+            if winner == holder:
+                self._aged_hold += dt
+            else:
+                self._aged_winner = winner
+                self._aged_hold = 0.0
+                self._aged_boost = ages.get(winner, 0.0) * scale
+            cap = self._age_cap
+            self._age = {
+                module: 0.0 if module == winner else min(cap, ages.get(module, 0.0) + dt) for module in active
+            }
+            return best[3]
+
+    def _expire_states(self, now: float) -> None:
+        """
+        Age states that have expired at `now` and recompute the next expiry deadline.
+        
+        An expired state is dropped, unless its module has a rule configuring ``stale_decay``. Such a state is marked stale and kept for a grace period as long as its original timeout, during which only the rules with a ``stale_decay`` apply, at a decayed weight. This keeps a screen up across a short lapse in reports instead of bouncing through the idle cycle. A stale state that expires again is dropped.
+        
+        Surviving states are kept in a new dict built in a single pass; the expiry test of :meth:`ModuleState.is_expired` is inlined. Callers must hold ``_states_lock``.
+        """
+        survivors: Dict[str, ModuleState] = {}
+        staled: List[Tuple[str, ModuleState]] = []
+        next_expiry = math.inf
+        grace_modules = self._grace_modules
+        for name, state in self._states.items():
+            expires_at = state.expires_at
+            if now > expires_at:
+                if state.stale or name not in grace_modules:
+                    continue
+                expires_at += expires_at - state.timestamp
+                if now > expires_at:
+                    continue
+                state.stale = True
+                state.expires_at = expires_at
+                staled.append((name, state))
+            if expires_at < next_expiry:
+                next_expiry = expires_at
+            survivors[name] = state
+        if len(survivors) != len(self._states):
+            self._states = survivors
+            self._active_weights = {name: entry for name, entry in self._active_weights.items() if name in survivors}
+            self._resolution_dirty = True
+        self._next_expiry = next_expiry
+        for name, state in staled:
+            self._rank_state(name, state)
+
+    def _rank_state(self, module: str, module_state: ModuleState) -> None:
+        """
+        Record the best priority rule matching `module_state` for `module`. Callers must hold ``_states_lock``.
+        
+        Considers each PriorityRule for the module and, if the rule specifies allowed states, only when the module's state is in that set; the matching rules are cached per (module, state) pair. For each matching rule the effective weight is the module state's `weight_override` when present, otherwise the rule's `weight`; a stale state only matches rules with a `stale_decay`, which scales its weight. The highest weight wins, earlier rules winning ties.
+        """
+        rules = self._rules_by_module.get(module)
+        if not rules:
+            if self._active_weights.pop(module, None) is not None:
+                self._resolution_dirty = True
+            return
 
-        for rule in self._rules:
-            module_state = self._states.get(rule.module)
-            if module_state is None:
-                continue
-            if rule.states and module_state.state not in rule.states:
-                continue
-            weight = module_state.weight_override if module_state.weight_override is not None else rule.weight
-            if weight > best_weight:
+        key = (module, module_state.state)
+        matching = self._matching_rules.get(key)
+        if matching is None:
+            matching = tuple(
+                (index, rule) for index, rule in rules if not rule.states or module_state.state in rule.states
+            )
+            # Bound the cache in case a module reports free-form state strings.
+            if len(self._matching_rules) >= _MATCHING_RULES_LIMIT:
+                self._matching_rules.clear()
+            self._matching_rules[key] = matching
+
+        override = module_state.weight_override
+        stale = module_state.stale
+        best_weight = None
+        best_index = 0
+        best_screen = ""
+        for index, rule in matching:
+            weight = override if override is not None else rule.weight
+            if stale:
+                if rule.stale_decay is None:
+                    continue
+                weight *= rule.stale_decay
+            if best_weight is None or weight > best_weight:
                 best_weight = weight
+                best_index = index
                 best_screen = rule.screen
 
-        return best_screen
+        if best_weight is None:
+            if self._active_weights.pop(module, None) is not None:
+                self._resolution_dirty = True
+            return
+        entry = (-best_weight, best_index, best_screen)
+        # Modules report every frame; an unchanged ranking leaves the resolved screen
+        # and the heap as they are.
+        if self._active_weights.get(module) == entry:
+            return
+        self._active_weights[module] = entry
+        self._resolution_dirty = True
+        heap = self._weight_heap
+        heapq.heappush(heap, (-best_weight, best_index, module, best_screen))
+        # Modules that keep reporting under a higher-priority winner would grow the heap unbounded.
+        if len(heap) > 4 * len(self._active_weights) + 16:
+            heap[:] = [(entry[0], entry[1], name, entry[2]) for name, entry in self._active_weights.items()]
+            heapq.heapify(heap)
 
     # --------------------------------------------------------------------- states
     def report_state(
@@ -369,19 +624,29 @@ class ModuleManager:
         Parameters:
             module (str): Name of the module reporting the state.
             state (str): State identifier reported by the module.
-            metadata (Optional[Dict[str, Any]]): Arbitrary additional data associated with the state (defaults to empty dict).
+            metadata (Optional[Dict[str, Any]]): Arbitrary additional data associated with the state (defaults to a shared, read-only empty mapping).
             weight (Optional[int]): Optional weight override used when resolving priority; if omitted the configured rule weight will be used.
             expires_in (Optional[float]): Optional lifetime in seconds for this state; a non-positive or None value means no expiration.
         
         Notes:
             This replaces any previously stored state for the given module.
         """
-        self._states[module] = ModuleState(
-            state=state,
-            metadata=metadata or {},
+        module = _intern(module)
+        now = time.monotonic()
+        timeout = expires_in if expires_in is not None else self._state_timeout
+        module_state = ModuleState(
+            state=_intern(state),
+            metadata=metadata or _EMPTY_METADATA,
             weight_override=weight,
             expires_in=expires_in,
+            timestamp=now,
+            expires_at=now + timeout if timeout > 0 else math.inf,
         )
+        with self._states_lock:
+            self._states[module] = module_state
+            if module_state.expires_at < self._next_expiry:
+                self._next_expiry = module_state.expires_at
+            self._rank_state(module, module_state)
 
     def clear_state(self, module: str) -> None:
         """
@@ -390,7 +655,10 @@ class ModuleManager:
         Parameters:
             module (str): Name of the module whose recorded state should be cleared.
         """
-        self._states.pop(module, None)
+        with self._states_lock:
+            self._states.pop(module, None)
+            if self._active_weights.pop(module, None) is not None:
+                self._resolution_dirty = True
 
     # ---------------------------------------------------------------- utilities
     @staticmethod
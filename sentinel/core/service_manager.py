@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping, Optional
 
 from sentinel.config import ServiceSettings
 
 
+@lru_cache(maxsize=None)
 def _import_string(target: str) -> Any:
-    """Import *target* which may be ``module`` or ``module:attribute``."""
+    """Import *target* which may be ``module`` or ``module:attribute``.
+
+    Results are memoized per target; failed imports raise and are retried.
+    """
 
     module_path, _, attr = target.partition(":")
     module = import_module(module_path)
@@ -29,6 +34,8 @@ class ServiceManager:
         self.app = app
         self._service_defs = dict(services)
         self._instances: Dict[str, Any] = {}
+        # Bound ``stop`` methods resolved once when each service starts.
+        self._stoppers: Dict[str, Optional[Callable[[], Any]]] = {}
 
     # ------------------------------------------------------------------ lifecycle
     def start_all(self) -> None:
@@ -48,19 +55,21 @@ class ServiceManager:
             start = getattr(instance, "start", None)
             if callable(start):
                 start()
+            stop = getattr(instance, "stop", None)
             self._instances[name] = instance
+            self._stoppers[name] = stop if callable(stop) else None
 
     def stop_all(self) -> None:
         """Stop every running service and clear instances."""
 
-        for name, instance in list(self._instances.items()):
-            stop = getattr(instance, "stop", None)
-            if callable(stop):
+        for name, stop in list(self._stoppers.items()):
+            if stop is not None:
                 try:
                     stop()
                 except Exception as exc:  # pragma: no cover - defensive logging
                     print(f"Error stopping service '{name}': {exc}")
             self._instances.pop(name, None)
+            self._stoppers.pop(name, None)
 
     # ------------------------------------------------------------------ accessors
     def get(self, name: str) -> Any:
@@ -1,9 +1,17 @@
-"""Built-in screen modules shipped with the Sentinel application."""
+"""Built-in screen modules shipped with the Sentinel application.
 
-from .camera.screen import CameraModule
-from .radar.screen import RadarModule
-from .neo.screen import NeoTrackerModule
-from .eonet.screen import EONETGlobeModule
+The module classes are imported on first attribute access (PEP 562) so that
+loading one screen does not pull in the dependencies of every other one.
+"""
+
+from importlib import import_module
+
+_LAZY_MODULES = {
+    "CameraModule": ".camera.screen",
+    "RadarModule": ".radar.screen",
+    "NeoTrackerModule": ".neo.screen",
+    "EONETGlobeModule": ".eonet.screen",
+}
 
 __all__ = [
     "CameraModule",
@@ -11,3 +19,16 @@ __all__ = [
     "NeoTrackerModule",
     "EONETGlobeModule",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
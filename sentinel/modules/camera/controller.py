@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import io
-import random
+import sys
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from typing import Deque, Dict, Mapping, Optional, Tuple
 
 import cv2
@@ -17,6 +19,17 @@ import pygame
 import requests
 
 
+_EMPTY_GRID = np.zeros((0, 0), dtype=np.uint8)
+_EMPTY_GRID.flags.writeable = False
+
+
+def _intern_all(values):
+    """Yield *values* with any strings interned."""
+
+    for value in values:
+        yield sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class Viewport:
     """Describe the viewport and snapshot dimensions used by the camera module."""
@@ -31,31 +44,94 @@ class CameraController:
 
     def __init__(self, core_config: Mapping[str, object]) -> None:
         self._core_config = core_config
+        self._load_settings()
         self._lock = threading.RLock()
-        self._detection_buffer: Deque[Tuple[float, Dict]] = deque()
+        # Bounded so a stalled update loop cannot grow it without limit; the
+        # oldest payloads are dropped first.
+        self._detection_buffer: Deque[Tuple[float, Dict]] = deque(maxlen=self._cfg_detection_buffer_max)
         self._active_detections: Dict[str, Dict] = {}
+        # Read-only copy republished after each batch of changes, so readers
+        # share one snapshot instead of copying the dict on every access.
+        self._detections_view: Mapping[str, Dict] = MappingProxyType({})
         self._last_event_time = "--"
         self._target_label = "--"
         self._target_score = "--"
         self._snapshot_surface: Optional[pygame.Surface] = None
-        resolution = core_config.get("frigate_resolution", (1920, 1080))
-        if not (isinstance(resolution, (list, tuple)) and len(resolution) == 2):
-            resolution = (1920, 1080)
+        # Snapshots are fetched on a small worker pool over one keep-alive
+        # session rather than a fresh thread and connection per detection.
+        self._session = requests.Session()
+        self._snapshot_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="CameraSnapshot")
+        resolution = self._cfg_resolution
         self._zoom_target_rect = pygame.Rect(0, 0, resolution[0], resolution[1])
         self._current_zoom_rect = self._zoom_target_rect.copy()
+        # x/y/w/h mirrors of the rects above so the zoom lerp is one array op.
+        self._zoom_target_xywh = np.array(self._zoom_target_rect, dtype=np.float64)
+        self._zoom_xywh = self._zoom_target_xywh.copy()
+        # Immutable copy of the current rect, swapped in after every update so
+        # readers can take it without the lock or a Rect copy.
+        self._zoom_view: Tuple[int, int, int, int] = tuple(self._current_zoom_rect)
         self._zoom_reset_timer = 0.0
         self._is_zoomed = False
         self._show_zoom_grid = False
-        self._zoom_grid_map: list[list[int]] = []
+        self._zoom_grid_map: np.ndarray = _EMPTY_GRID
         self._zoom_grid_update_timer = 0.0
+        # Bumped whenever the zoom grid map is replaced so renderers can cache
+        # whatever they derive from it.
+        self._grid_version = 0
         self._alert_level = "none"
         self._current_surface: Optional[pygame.Surface] = None
         self._viewport = Viewport(pygame.Rect(0, 0, 1, 1), (0, 0), 40)
+        # Frames arrive on the video thread while the UI thread blits the
+        # published surface, so frames are written into two persistent
+        # surfaces in turn rather than into the one on screen.
+        self._frame_surfaces: Tuple[pygame.Surface, ...] = ()
+        self._frame_index = 0
+        self._resize_buffer: Optional[np.ndarray] = None
+        # BGRX scratch buffer used when the surfaces are little-endian 0xRRGGBB
+        # words, letting a frame be copied in as packed 32-bit pixels.
+        self._packed_buffer: Optional[np.ndarray] = None
+        # Frames are only converted while the camera screen is showing. The
+        # last converted frame is kept (not just its address, which the
+        # allocator could hand to the next frame) so a republished frame with
+        # an unchanged crop can be skipped.
+        self._visible = False
+        self._last_frame_key: Optional[tuple] = None
 
     # ------------------------------------------------------------------ configuration
+    def _load_settings(self) -> None:
+        """Parse the core settings read on every update into typed attributes."""
+
+        core_config = self._core_config
+        resolution = core_config.get("frigate_resolution", (1920, 1080))
+        if not (isinstance(resolution, (list, tuple)) and len(resolution) == 2):
+            resolution = (1920, 1080)
+        self._cfg_resolution: Tuple[int, int] = tuple(resolution)
+        self._cfg_camera_name = core_config.get("camera_name")
+        self._cfg_bbox_delay = float(core_config.get("bbox_delay", 0.4))
+        self._cfg_detection_buffer_max = max(1, int(core_config.get("detection_buffer_max", 1024)))
+        self._cfg_zoom_speed = float(core_config.get("zoom_speed", 0.08))
+        self._cfg_zoom_level = float(core_config.get("zoom_level", 2.5))
+        self._cfg_zoom_reset_time = float(core_config.get("zoom_reset_time", 5))
+        self._cfg_zoom_labels = frozenset(_intern_all(core_config.get("zoom_labels", [])))
+        alert_zones = core_config.get("alert_zones", {})
+        self._cfg_danger_zones = frozenset(_intern_all(alert_zones.get("danger", [])))
+        self._cfg_warning_zones = frozenset(_intern_all(alert_zones.get("warning", [])))
+
     def configure_view(self, viewport_rect: pygame.Rect, snapshot_size: Tuple[int, int], grid_cell_size: int) -> None:
         with self._lock:
             self._viewport = Viewport(viewport_rect.copy(), snapshot_size, grid_cell_size)
+            width, height = viewport_rect.size
+            if width > 0 and height > 0:
+                self._frame_surfaces = (pygame.Surface((width, height), 0, 32), pygame.Surface((width, height), 0, 32))
+                self._resize_buffer = np.empty((height, width, 3), dtype=np.uint8)
+                packed = sys.byteorder == "little" and self._frame_surfaces[0].get_masks()[:3] == (0xFF0000, 0xFF00, 0xFF)
+                self._packed_buffer = np.empty((height, width, 4), dtype=np.uint8) if packed else None
+            else:
+                self._frame_surfaces = ()
+                self._resize_buffer = None
+                self._packed_buffer = None
+            self._frame_index = 0
+            self._last_frame_key = None
             self._refresh_zoom_grid(force=True)
 
     # ------------------------------------------------------------------ properties
@@ -81,9 +157,16 @@ class CameraController:
             return self._snapshot_surface
 
     @property
-    def zoom_grid_map(self):
+    def zoom_grid_map(self) -> np.ndarray:
+        """Read-only grid map; a new array is published on every refresh."""
+
         with self._lock:
-            return list(self._zoom_grid_map)
+            return self._zoom_grid_map
+
+    @property
+    def zoom_grid_version(self) -> int:
+        with self._lock:
+            return self._grid_version
 
     @property
     def current_zoom_rect(self) -> pygame.Rect:
@@ -91,9 +174,13 @@ class CameraController:
             return self._current_zoom_rect.copy()
 
     @property
-    def active_detections(self) -> Dict[str, Dict]:
+    def current_zoom_xywh(self) -> Tuple[int, int, int, int]:
+        return self._zoom_view
+
+    @property
+    def active_detections(self) -> Mapping[str, Dict]:
         with self._lock:
-            return dict(self._active_detections)
+            return self._detections_view
 
     @property
     def show_zoom_grid(self) -> bool:
@@ -110,51 +197,91 @@ class CameraController:
         with self._lock:
             self._detection_buffer.clear()
             self._active_detections.clear()
+            self._detections_view = MappingProxyType({})
             self._last_event_time = "--"
             self._target_label = "--"
             self._target_score = "--"
             self._snapshot_surface = None
-            resolution = self._core_config.get("frigate_resolution", (1920, 1080))
-            if not (isinstance(resolution, (list, tuple)) and len(resolution) == 2):
-                resolution = (1920, 1080)
+            resolution = self._cfg_resolution
             self._zoom_target_rect = pygame.Rect(0, 0, resolution[0], resolution[1])
             self._current_zoom_rect = self._zoom_target_rect.copy()
+            self._zoom_target_xywh[:] = self._zoom_target_rect
+            self._zoom_xywh[:] = self._zoom_target_rect
+            self._zoom_view = tuple(self._current_zoom_rect)
             self._zoom_reset_timer = 0.0
             self._is_zoomed = False
             self._show_zoom_grid = False
-            self._zoom_grid_map = []
+            self._zoom_grid_map = _EMPTY_GRID
+            self._grid_version += 1
             self._zoom_grid_update_timer = 0.0
             self._current_surface = None
+            self._last_frame_key = None
         self._alert_level = "none"
 
+    def close(self) -> None:
+        """Stop the snapshot workers and release the pooled HTTP connections."""
+
+        # Pending fetches are dropped (Python 3.9+) and a running one is not
+        # waited for, so unloading never blocks on a slow camera host.
+        if sys.version_info >= (3, 9):
+            self._snapshot_pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._snapshot_pool.shutdown(wait=False)
+        self._session.close()
+
     def queue_detection(self, payload: Dict) -> None:
         self._detection_buffer.append((time.time(), payload))
 
     # ------------------------------------------------------------------ frame handling
     def process_frame(self, frame) -> None:
+        if not self._visible:
+            return
         viewport = self._viewport
         if viewport.viewport_rect.width <= 0 or viewport.viewport_rect.height <= 0:
             return
         with self._lock:
-            zoom_rect = self._current_zoom_rect.copy()
+            if not self._frame_surfaces:
+                return
+            target = self._frame_surfaces[self._frame_index]
+            resize_buffer = self._resize_buffer
+            packed_buffer = self._packed_buffer
+            last_key = self._last_frame_key
+        zoom_x, zoom_y, zoom_w, zoom_h = self._zoom_view
         h, w = frame.shape[:2]
-        x1 = int(max(0, min(zoom_rect.x, w - 1)))
-        y1 = int(max(0, min(zoom_rect.y, h - 1)))
-        x2 = int(max(0, min(zoom_rect.x + zoom_rect.w, w)))
-        y2 = int(max(0, min(zoom_rect.y + zoom_rect.h, h)))
+        x1 = int(max(0, min(zoom_x, w - 1)))
+        y1 = int(max(0, min(zoom_y, h - 1)))
+        x2 = int(max(0, min(zoom_x + zoom_w, w)))
+        y2 = int(max(0, min(zoom_y + zoom_h, h)))
         if x2 <= x1 or y2 <= y1:
             return
+        crop = (x1, y1, x2, y2)
+        if last_key is not None and last_key[0] is frame and last_key[1] == crop:
+            return
         zoomed = frame[y1:y2, x1:x2]
         if zoomed.size == 0:
             return
-        resized = cv2.resize(zoomed, viewport.viewport_rect.size)
-        rotated = np.rot90(np.fliplr(cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)))
-        surface = pygame.surfarray.make_surface(rotated)
+        # OpenCV hands back the preallocated buffer when the shapes match and a
+        # fresh array otherwise, so always use the returned value.
+        resized = cv2.resize(zoomed, target.get_size(), dst=resize_buffer)
+        # surfarray indexes pixels as [x, y]; a transposed view replaces the
+        # old fliplr + rot90 pair without another copy.
+        if packed_buffer is not None and resized.ndim == 3 and resized.shape[2] == 3:
+            # BGR -> BGRX bytes are exactly the surface's pixel words, so the
+            # copy into the surface needs no per-channel repacking.
+            bgrx = cv2.cvtColor(resized, cv2.COLOR_BGR2BGRA, dst=packed_buffer)
+            pygame.surfarray.blit_array(target, bgrx.view(np.uint32)[:, :, 0].T)
+        else:
+            rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=resized)
+            pygame.surfarray.blit_array(target, rgb.swapaxes(0, 1))
         with self._lock:
-            self._current_surface = surface
+            if target in self._frame_surfaces:
+                self._current_surface = target
+                self._frame_index ^= 1
+                self._last_frame_key = (frame, crop)
 
     # ------------------------------------------------------------------ update cycle
     def update(self, *, on_camera_screen: bool) -> None:
+        self._visible = on_camera_screen
         self._process_detection_buffer()
         self._update_alert_level()
         if on_camera_screen:
@@ -162,92 +289,106 @@ class CameraController:
         self._update_zoom()
 
     def _process_detection_buffer(self) -> None:
-        bbox_delay = float(self._core_config.get("bbox_delay", 0.4))
+        bbox_delay = self._cfg_bbox_delay
+        camera_name = self._cfg_camera_name
         now = time.time()
+        last_update: Optional[Dict] = None
+        changed = False
         while self._detection_buffer and (now - self._detection_buffer[0][0] > bbox_delay):
             _, payload = self._detection_buffer.popleft()
             event_type = payload.get("type")
             detection = payload.get("after", {}) or {}
-            if detection.get("camera") != self._core_config.get("camera_name"):
+            if detection.get("camera") != camera_name:
                 continue
             detection_id = detection.get("id")
             if not detection_id:
                 continue
+            # Ids, labels and zones repeat across events and are used as keys
+            # and set members, so intern them once on ingest.
+            if type(detection_id) is str:
+                detection_id = sys.intern(detection_id)
             is_new = False
             with self._lock:
                 if event_type == "end":
-                    self._active_detections.pop(detection_id, None)
+                    changed = self._active_detections.pop(detection_id, None) is not None or changed
                 else:
+                    # The payload is shared with every other bus subscriber, so the
+                    # interned values go into the controller's own copy.
+                    detection = dict(detection)
+                    label = detection.get("label")
+                    if type(label) is str:
+                        detection["label"] = sys.intern(label)
+                    detection["entered_zones"] = tuple(_intern_all(detection.get("entered_zones") or ()))
                     is_new = detection_id not in self._active_detections
                     self._active_detections[detection_id] = detection
-                    self._last_event_time = datetime.now().strftime("%H:%M:%S")
-                    self._target_label = detection.get("label", "--").upper()
-                    self._target_score = f"{(detection.get('score', 0) * 100):.1f}%"
+                    last_update = detection
+                    changed = True
             if is_new:
-                threading.Thread(
-                    target=self._fetch_snapshot_image,
-                    args=(detection_id,),
-                    daemon=True,
-                ).start()
+                self._snapshot_pool.submit(self._fetch_snapshot_image, detection_id)
+        if changed:
+            with self._lock:
+                self._detections_view = MappingProxyType(dict(self._active_detections))
+        if last_update is not None:
+            # Only the newest detection is shown, so format once per burst.
+            event_time = datetime.now().strftime("%H:%M:%S")
+            label = last_update.get("label", "--").upper()
+            score = f"{(last_update.get('score', 0) * 100):.1f}%"
+            with self._lock:
+                self._last_event_time = event_time
+                self._target_label = label
+                self._target_score = score
 
     def _update_alert_level(self) -> None:
         current_level = "none"
-        zoom_labels = set(self._core_config.get("zoom_labels", []))
-        alert_zones = self._core_config.get("alert_zones", {})
-        danger_zones = set(alert_zones.get("danger", []))
-        warning_zones = set(alert_zones.get("warning", []))
+        zoom_labels = self._cfg_zoom_labels
+        danger_zones = self._cfg_danger_zones
+        warning_zones = self._cfg_warning_zones
         with self._lock:
-            detections = list(self._active_detections.values())
-        for detection in detections:
+            detections = self._detections_view
+        for detection in detections.values():
             if detection.get("label") not in zoom_labels:
                 continue
-            entered_zones = detection.get("entered_zones", [])
-            if any(zone in danger_zones for zone in entered_zones):
+            entered_zones = detection.get("entered_zones", ())
+            if not danger_zones.isdisjoint(entered_zones):
                 current_level = "danger"
                 break
-            if any(zone in warning_zones for zone in entered_zones):
+            if not warning_zones.isdisjoint(entered_zones):
                 current_level = "warning"
         self._alert_level = current_level
 
     def _update_zoom_priority(self) -> None:
-        zoom_labels = set(self._core_config.get("zoom_labels", []))
+        zoom_labels = self._cfg_zoom_labels
+        danger_zones = self._cfg_danger_zones
+        warning_zones = self._cfg_warning_zones
+        # Highest-scoring zoomable detection overall and inside each alert
+        # zone set, found in a single pass; ties keep the first seen.
+        best_any = best_danger = best_warning = None
+        any_score = danger_score = warning_score = 0
         with self._lock:
-            zoomable = [
-                d
-                for d in self._active_detections.values()
-                if d.get("label") in zoom_labels
-            ]
-        if not zoomable:
+            detections = self._detections_view
+        for detection in detections.values():
+            if detection.get("label") not in zoom_labels:
+                continue
+            score = detection.get("score", 0)
+            if best_any is None or score > any_score:
+                best_any, any_score = detection, score
+            entered_zones = detection.get("entered_zones", ())
+            if not danger_zones.isdisjoint(entered_zones) and (best_danger is None or score > danger_score):
+                best_danger, danger_score = detection, score
+            if not warning_zones.isdisjoint(entered_zones) and (best_warning is None or score > warning_score):
+                best_warning, warning_score = detection, score
+        if best_any is None:
             self._is_zoomed = False
             return
 
-        def in_zone(detection, zones):
-            entered = detection.get("entered_zones", [])
-            return any(zone in zones for zone in entered)
-
-        alert_zones = self._core_config.get("alert_zones", {})
-        danger_zones = set(alert_zones.get("danger", []))
-        warning_zones = set(alert_zones.get("warning", []))
-        danger = [d for d in zoomable if in_zone(d, danger_zones)]
-        warning = [d for d in zoomable if in_zone(d, warning_zones)]
-
-        if danger:
-            target = max(danger, key=lambda d: d.get("score", 0))
-        elif warning:
-            target = max(warning, key=lambda d: d.get("score", 0))
-        else:
-            target = max(zoomable, key=lambda d: d.get("score", 0))
-
+        target = best_danger or best_warning or best_any
         if target:
             self._is_zoomed = True
-            self._zoom_reset_timer = time.time() + float(self._core_config.get("zoom_reset_time", 5))
+            self._zoom_reset_timer = time.time() + self._cfg_zoom_reset_time
             self._update_zoom_target(target)
 
     def _update_zoom_target(self, detection: Dict) -> None:
-        resolution = self._core_config.get("frigate_resolution", (1920, 1080))
-        if not (isinstance(resolution, (list, tuple)) and len(resolution) == 2):
-            resolution = (1920, 1080)
-        src_w, src_h = resolution
+        src_w, src_h = self._cfg_resolution
         box = detection.get("box")
         if not box:
             return
@@ -257,9 +398,10 @@ class CameraController:
         center_y = box[1] + box_h / 2
         viewport = self._viewport.viewport_rect
         target_ar = viewport.width / viewport.height if viewport.height else 1
-        zoom_h = box_h * float(self._core_config.get("zoom_level", 2.5))
+        zoom_level = self._cfg_zoom_level
+        zoom_h = box_h * zoom_level
         zoom_w = zoom_h * target_ar
-        min_zoom_w = box_w * float(self._core_config.get("zoom_level", 2.5))
+        min_zoom_w = box_w * zoom_level
         if zoom_w < min_zoom_w:
             zoom_w = min_zoom_w
             zoom_h = zoom_w / target_ar
@@ -269,23 +411,25 @@ class CameraController:
         zoom_y = max(0, min(center_y - zoom_h / 2, src_h - zoom_h))
         with self._lock:
             self._zoom_target_rect.update(zoom_x, zoom_y, zoom_w, zoom_h)
+            self._zoom_target_xywh[:] = self._zoom_target_rect
 
     def _update_zoom(self) -> None:
-        resolution = self._core_config.get("frigate_resolution", (1920, 1080))
-        if not (isinstance(resolution, (list, tuple)) and len(resolution) == 2):
-            resolution = (1920, 1080)
-        src_w, src_h = resolution
-        speed = float(self._core_config.get("zoom_speed", 0.08))
+        src_w, src_h = self._cfg_resolution
+        speed = self._cfg_zoom_speed
         with self._lock:
-            if not self._is_zoomed and self._current_zoom_rect.w < src_w * 0.99:
+            current = self._zoom_xywh
+            if not self._is_zoomed and current[2] < src_w * 0.99:
                 self._zoom_target_rect.update(0, 0, src_w, src_h)
+                self._zoom_target_xywh[:] = self._zoom_target_rect
             if self._is_zoomed and time.time() > self._zoom_reset_timer:
                 self._is_zoomed = False
-            self._current_zoom_rect.x += (self._zoom_target_rect.x - self._current_zoom_rect.x) * speed
-            self._current_zoom_rect.y += (self._zoom_target_rect.y - self._current_zoom_rect.y) * speed
-            self._current_zoom_rect.w += (self._zoom_target_rect.w - self._current_zoom_rect.w) * speed
-            self._current_zoom_rect.h += (self._zoom_target_rect.h - self._current_zoom_rect.h) * speed
-            self._show_zoom_grid = self._current_zoom_rect.w < src_w * 0.99
+            current += (self._zoom_target_xywh - current) * speed
+            # Round half away from zero like pygame.Rect's float setters so
+            # the zoom keeps settling on whole pixels.
+            np.trunc(current + np.copysign(0.5, current), out=current)
+            self._current_zoom_rect.update(current)
+            self._zoom_view = tuple(self._current_zoom_rect)
+            self._show_zoom_grid = current[2] < src_w * 0.99
         if self._show_zoom_grid and time.time() > self._zoom_grid_update_timer:
             self._refresh_zoom_grid()
 
@@ -301,23 +445,19 @@ class CameraController:
         center_x = viewport.viewport_rect.width / 2
         center_y = viewport.viewport_rect.height / 2
         max_dist = (center_x ** 2 + center_y ** 2) ** 0.5 or 1
-        new_map = []
-        for r in range(rows):
-            row = []
-            for c in range(cols):
-                cell_x = (c + 0.5) * grid_size
-                cell_y = (r + 0.5) * grid_size
-                dist_norm = ((cell_x - center_x) ** 2 + (cell_y - center_y) ** 2) ** 0.5 / max_dist
-                threshold = random.random() * 0.4
-                pattern_type = 0
-                if dist_norm > 0.2 + threshold:
-                    pattern_type = 1
-                if dist_norm > 0.6 + threshold:
-                    pattern_type = 2
-                row.append(pattern_type)
-            new_map.append(row)
+        cell_x = (np.arange(cols) + 0.5) * grid_size
+        cell_y = (np.arange(rows) + 0.5) * grid_size
+        dist_norm = np.hypot(cell_x[None, :] - center_x, cell_y[:, None] - center_y) / max_dist
+        threshold = np.random.random((rows, cols)) * 0.4
+        new_map = np.where(
+            dist_norm > 0.6 + threshold,
+            2,
+            np.where(dist_norm > 0.2 + threshold, 1, 0),
+        ).astype(np.uint8)
+        new_map.flags.writeable = False
         with self._lock:
             self._zoom_grid_map = new_map
+            self._grid_version += 1
         self._zoom_grid_update_timer = time.time() + 0.5
 
     # ------------------------------------------------------------------ assets
@@ -327,7 +467,7 @@ class CameraController:
             return
         url = f"http://{host}:5000/api/events/{event_id}/snapshot.jpg?crop=1"
         try:
-            response = requests.get(url, timeout=3)
+            response = self._session.get(url, timeout=3)
             response.raise_for_status()
             image = pygame.image.load(io.BytesIO(response.content))
         except (requests.RequestException, pygame.error) as exc:
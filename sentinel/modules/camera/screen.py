@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import random
 import time
-from collections import deque
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pygame
 
 import config
@@ -13,8 +14,32 @@ from sentinel.modules.common import draw_dashed_line
 
 from .controller import CameraController
 
+# pygame-ce's Surface.fblits skips building the rect list and caches state
+# across consecutive blits of the same source; plain pygame uses blits().
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
 
+_STATUS_LABELS = ("MQTT LINK:", "VIDEO FEED:", "CAMERA:", "LAST EVENT:", "TARGET:", "CONFIDENCE:")
+# Scores are shown as whole percentages, so a handful of tracked objects only
+# ever produce a few distinct box labels; the cache is dropped when it fills.
+_BOX_LABEL_CACHE_SIZE = 64
+
+
+def _convert_for_display(surface: pygame.Surface) -> pygame.Surface:
+    """Return *surface* in the display's alpha format for fast repeated blits.
+
+    convert_alpha() needs a video mode, so the surface is returned unchanged
+    when none is set.
+    """
+
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+@lru_cache(maxsize=32)
 def _create_tiled_pattern_surface(pattern_type: str, size: int, color) -> pygame.Surface:
+    """Return a *size* square tile of the pattern; shared, so do not draw on it."""
+
     base_pattern_size = 10
     base_surface = pygame.Surface((base_pattern_size + 1, base_pattern_size), pygame.SRCALPHA)
     if pattern_type == 'dots':
@@ -25,7 +50,7 @@ def _create_tiled_pattern_surface(pattern_type: str, size: int, color) -> pygame
     for x in range(0, size, base_pattern_size):
         for y in range(0, size, base_pattern_size):
             tiled_surface.blit(base_surface, (x, y))
-    return tiled_surface
+    return _convert_for_display(tiled_surface)
 
 
 class CameraModule(ScreenModule):
@@ -35,7 +60,11 @@ class CameraModule(ScreenModule):
         super().__init__(config=config)
         self.controller: Optional[CameraController] = None
         self._subscriptions: list[tuple[str, object]] = []
-        self._graph_data: deque[float] = deque()
+        # Ring buffer of analysis graph samples; ``_graph_head`` is the next slot
+        # to write and ``_graph_len`` how many slots hold samples.
+        self._graph_buf = np.zeros(0, dtype=np.float64)
+        self._graph_head = 0
+        self._graph_len = 0
         self._mqtt_activity = 0.0
         self._mqtt_status = "CONNECTING..."
         self._video_status = "INITIALIZING"
@@ -46,6 +75,26 @@ class CameraModule(ScreenModule):
         self.patterns_green: dict[str, pygame.Surface] = {}
         self.patterns_orange: dict[str, pygame.Surface] = {}
         self.patterns_red: dict[str, pygame.Surface] = {}
+        self._grid_layer_cache: Optional[pygame.Surface] = None
+        self._grid_layer_key: Optional[tuple] = None
+        self._label_surfaces: list[pygame.Surface] = []
+        self._label_surfaces_key: Optional[tuple] = None
+        self._scan_surfaces: tuple[pygame.Surface, ...] = ()
+        self._value_surfaces: list[Optional[tuple[str, pygame.Surface]]] = []
+        self._value_font = None
+        self._box_label_surfaces: dict[str, pygame.Surface] = {}
+        self._box_label_key: Optional[tuple] = None
+        # Screen x coordinate of each analysis graph sample.
+        self._graph_xs: list[int] = []
+        self._graph_xs_key: Optional[tuple] = None
+        self._scanner_surface: Optional[pygame.Surface] = None
+        self._graph_grid_layer: Optional[pygame.Surface] = None
+        self._graph_grid_key: Optional[tuple] = None
+        # Translucent variants of the theme colour, rebuilt when it changes.
+        self._theme_color: Optional[tuple] = None
+        self._grid_rgba: tuple = ()
+        self._graph_grid_rgba: tuple = ()
+        self._scanner_trail_rgba: tuple = ()
 
     # ------------------------------------------------------------------ lifecycle
     def on_load(self) -> None:
@@ -53,7 +102,9 @@ class CameraModule(ScreenModule):
             return
         self.controller = CameraController(self.app.core_settings)
         self._setup_layout()
-        self._graph_data = deque(maxlen=self.analysis_graph_rect.width)
+        self._graph_buf = np.zeros(max(0, self.analysis_graph_rect.width), dtype=np.float64)
+        self._graph_head = 0
+        self._graph_len = 0
         bus = getattr(self.app, "event_bus", None)
         if bus:
             self._subscriptions = [
@@ -71,7 +122,10 @@ class CameraModule(ScreenModule):
         self._subscriptions = []
         if self.controller:
             self.controller.reset()
+            self.controller.close()
         self.controller = None
+        self._grid_layer_cache = None
+        self._grid_layer_key = None
 
     def on_show(self) -> None:
         if self.app:
@@ -121,11 +175,15 @@ class CameraModule(ScreenModule):
                 self.report_state(None)
 
         self._mqtt_activity *= 0.90
-        if self.analysis_graph_rect.width > 0:
+        capacity = len(self._graph_buf)
+        if capacity > 0:
             graph_h = self.analysis_graph_rect.height
             new_y = (graph_h - 15) - self._mqtt_activity + (random.random() - 0.5) * 8
             clamped = max(5, min(new_y, graph_h - 5))
-            self._graph_data.append(clamped)
+            self._graph_buf[self._graph_head] = clamped
+            self._graph_head = (self._graph_head + 1) % capacity
+            if self._graph_len < capacity:
+                self._graph_len += 1
 
         if self.controller.snapshot_surface:
             self._scanner_pos += self._scanner_dir
@@ -140,6 +198,7 @@ class CameraModule(ScreenModule):
         if not app or not controller:
             return
 
+        self._sync_theme_colors(app.current_theme_color)
         self._draw_video_feed(surface, controller)
         if controller.show_zoom_grid:
             self._draw_zoom_grid(surface, controller)
@@ -195,6 +254,14 @@ class CameraModule(ScreenModule):
         if self.controller:
             self.controller.configure_view(self.main_area_rect, self.col2_rect.size, self.grid_cell_size)
 
+    def _sync_theme_colors(self, color) -> None:
+        if color == self._theme_color:
+            return
+        self._theme_color = color
+        self._grid_rgba = color + (160,)
+        self._graph_grid_rgba = color + (100,)
+        self._scanner_trail_rgba = color + (25,)
+
     # ------------------------------------------------------------------ primitives
     def _draw_video_feed(self, surface: pygame.Surface, controller: CameraController) -> None:
         frame_surface = controller.current_surface
@@ -206,59 +273,105 @@ class CameraModule(ScreenModule):
         pygame.draw.rect(surface, self.app.current_theme_color, self.main_area_rect, 2)
 
     def _draw_zoom_grid(self, surface: pygame.Surface, controller: CameraController) -> None:
+        alert_level = controller.alert_level
+        grid_color = self._grid_rgba
+        # Read the version before the map: if a refresh lands in between, the
+        # next frame sees a newer version and rebuilds.
+        key = (
+            controller.zoom_grid_version,
+            alert_level,
+            grid_color,
+            self.main_area_rect.size,
+            self.grid_cell_size,
+        )
+        if key != self._grid_layer_key or self._grid_layer_cache is None:
+            self._grid_layer_cache = self._build_grid_layer(controller.zoom_grid_map, alert_level, grid_color)
+            self._grid_layer_key = key
+        surface.blit(self._grid_layer_cache, self.main_area_rect.topleft)
+
+    def _build_grid_layer(self, zoom_grid_map, alert_level: str, grid_color) -> pygame.Surface:
         grid_surface = pygame.Surface(self.main_area_rect.size, pygame.SRCALPHA)
 
-        if self.controller and self.controller.alert_level == "warning":
+        if alert_level == "warning":
             patterns = self.patterns_orange
-        elif self.controller and self.controller.alert_level == "danger":
+        elif alert_level == "danger":
             patterns = self.patterns_red
         else:
             patterns = self.patterns_green
 
-        grid_color = self.app.current_theme_color + (160,)
-
-        for r, row in enumerate(controller.zoom_grid_map):
-            for c, pattern_type in enumerate(row):
-                pos = (c * self.grid_cell_size, r * self.grid_cell_size)
-                if pattern_type == 1:
-                    grid_surface.blit(patterns["dots"], pos)
-                elif pattern_type == 2:
-                    grid_surface.blit(patterns["lines"], pos)
+        cell = self.grid_cell_size
+        dots = patterns["dots"]
+        lines = patterns["lines"]
+        # Only non-zero cells get a tile, so visit just those. Tiles are grouped
+        # by pattern so runs share a source surface.
+        blit_sequence = []
+        for pattern_type, tile in ((1, dots), (2, lines)):
+            rows, cols = np.nonzero(zoom_grid_map == pattern_type)
+            blit_sequence.extend(
+                (tile, (x, y)) for y, x in zip((rows * cell).tolist(), (cols * cell).tolist())
+            )
+        if _HAS_FBLITS:
+            grid_surface.fblits(blit_sequence)
+        else:
+            grid_surface.blits(blit_sequence, doreturn=False)
 
-        for x in range(0, self.main_area_rect.width, self.grid_cell_size):
+        # Gridlines are drawn straight onto the layer rather than blitted from
+        # a separate surface so they replace pattern pixels instead of
+        # alpha-blending over them.
+        for x in range(0, self.main_area_rect.width, cell):
             pygame.draw.line(grid_surface, grid_color, (x, 0), (x, self.main_area_rect.height), 1)
-        for y in range(0, self.main_area_rect.height, self.grid_cell_size):
+        for y in range(0, self.main_area_rect.height, cell):
             pygame.draw.line(grid_surface, grid_color, (0, y), (self.main_area_rect.width, y), 1)
-
-        surface.blit(grid_surface, self.main_area_rect.topleft)
+        return _convert_for_display(grid_surface)
 
     def _draw_bounding_boxes(self, surface: pygame.Surface, controller: CameraController) -> None:
-        zoom_rect = controller.current_zoom_rect
-        if zoom_rect.w == 0 or zoom_rect.h == 0:
+        zoom_x, zoom_y, zoom_w, zoom_h = controller.current_zoom_xywh
+        if zoom_w == 0 or zoom_h == 0:
             return
-        detections = list(controller.active_detections.values())
-        for detection in detections:
+        main_area = self.main_area_rect
+        area_x = main_area.x
+        area_y = main_area.y
+        scale_x = main_area.width / zoom_w
+        scale_y = main_area.height / zoom_h
+        # Bounds for rejecting boxes that lie entirely outside the view before
+        # building a Rect; the one pixel margin covers Rect's rounding.
+        reject_left = area_x - 1
+        reject_top = area_y - 1
+        reject_right = main_area.right + 1
+        reject_bottom = main_area.bottom + 1
+        color = self.app.current_theme_color
+        font = self.app.font_small
+        label_key = (font, color)
+        if label_key != self._box_label_key:
+            self._box_label_surfaces = {}
+            self._box_label_key = label_key
+        label_surfaces = self._box_label_surfaces
+        for detection in controller.active_detections.values():
             box = detection.get("box")
             if not box:
                 continue
-            box_x_rel = box[0] - zoom_rect.x
-            box_y_rel = box[1] - zoom_rect.y
-            scale_x = self.main_area_rect.width / zoom_rect.w
-            scale_y = self.main_area_rect.height / zoom_rect.h
-            x1 = box_x_rel * scale_x
-            y1 = box_y_rel * scale_y
+            x1 = area_x + (box[0] - zoom_x) * scale_x
+            y1 = area_y + (box[1] - zoom_y) * scale_y
             w = (box[2] - box[0]) * scale_x
             h = (box[3] - box[1]) * scale_y
-            box_rect = pygame.Rect(self.main_area_rect.x + x1, self.main_area_rect.y + y1, w, h)
-            clipped_box = box_rect.clip(self.main_area_rect)
+            if x1 >= reject_right or y1 >= reject_bottom or x1 + w <= reject_left or y1 + h <= reject_top:
+                continue
+            box_rect = pygame.Rect(x1, y1, w, h)
+            clipped_box = box_rect.clip(main_area)
             if clipped_box.width <= 0 or clipped_box.height <= 0:
                 continue
-            pygame.draw.rect(surface, self.app.current_theme_color, clipped_box, 1)
+            pygame.draw.rect(surface, color, clipped_box, 1)
             label = detection.get("label", "")
             score = detection.get("score", 0)
-            label_surface = self.app.font_small.render(f"{label.upper()} [{score:.0%}]", True, self.app.current_theme_color)
+            text = f"{label.upper()} [{score:.0%}]"
+            label_surface = label_surfaces.get(text)
+            if label_surface is None:
+                if len(label_surfaces) >= _BOX_LABEL_CACHE_SIZE:
+                    label_surfaces.clear()
+                label_surface = font.render(text, True, color)
+                label_surfaces[text] = label_surface
             label_pos_y = box_rect.y - 18
-            if label_pos_y < self.main_area_rect.y:
+            if label_pos_y < area_y:
                 label_pos_y = clipped_box.y + 2
             surface.blit(label_surface, (clipped_box.x + 2, label_pos_y))
 
@@ -269,20 +382,43 @@ class CameraModule(ScreenModule):
         y_offset = self.col1_rect.y + 2
         row_height = 14
         camera_name = self.config.get("camera_name") or config.CONFIG.get("camera_name", "")
-        texts = [
-            ("MQTT LINK:", self._mqtt_status),
-            ("VIDEO FEED:", self._video_status),
-            ("CAMERA:", camera_name.upper()),
-            ("LAST EVENT:", controller.last_event_time),
-            ("TARGET:", controller.target_label),
-            ("CONFIDENCE:", controller.target_score),
-        ]
-
-        for index, (label, value) in enumerate(texts):
+        values = (
+            self._mqtt_status,
+            self._video_status,
+            camera_name.upper(),
+            controller.last_event_time,
+            controller.target_label,
+            controller.target_score,
+        )
+
+        # The labels never change, so they are only re-rendered when the font
+        # or theme colour does.
+        font = self.app.font_small
+        labels_key = (font, color)
+        if labels_key != self._label_surfaces_key:
+            self._label_surfaces = [font.render(label, True, color) for label in _STATUS_LABELS]
+            # Indexed by blink phase: the cursor shows on even half-seconds.
+            self._scan_surfaces = (
+                font.render("> SCANNING FOR TARGETS_", True, color),
+                font.render("> SCANNING FOR TARGETS", True, color),
+            )
+            self._label_surfaces_key = labels_key
+        # Values change far less often than frames are drawn, so each row
+        # keeps its last rendered text; a font change invalidates them all.
+        if font is not self._value_font:
+            self._value_surfaces = [None] * len(_STATUS_LABELS)
+            self._value_font = font
+        value_surfaces = self._value_surfaces
+
+        for index, (label_surface, value) in enumerate(zip(self._label_surfaces, values)):
             y_pos = y_offset + index * row_height
-            label_surface = self.app.font_small.render(label, True, color)
             label_rect = label_surface.get_rect()
-            value_surface = self.app.font_small.render(str(value), True, (220, 220, 220))
+            text = str(value)
+            cached = value_surfaces[index]
+            if cached is None or cached[0] != text:
+                cached = (text, font.render(text, True, (220, 220, 220)))
+                value_surfaces[index] = cached
+            value_surface = cached[1]
             value_rect = value_surface.get_rect()
             label_rect.topleft = (self.col1_rect.x, y_pos)
             value_rect.topright = (self.col1_rect.right, y_pos)
@@ -306,15 +442,20 @@ class CameraModule(ScreenModule):
 
         pygame.draw.rect(surface, color, self.col2_rect, 1)
 
-        scan_text = "> SCANNING FOR TARGETS"
-        if int(time.time() * 2) % 2 == 0:
-            scan_text += "_"
-        surface.blit(self.app.font_small.render(scan_text, True, color), (self.col3_rect.x, self.col3_rect.y))
+        scan_surface = self._scan_surfaces[int(time.time() * 2) % 2]
+        surface.blit(scan_surface, (self.col3_rect.x, self.col3_rect.y))
         self._draw_analysis_graph(surface)
 
     def _draw_snapshot_scanner(self, surface: pygame.Surface) -> None:
-        scanner_surface = pygame.Surface(self.col2_rect.size, pygame.SRCALPHA)
-        trail_color = self.app.current_theme_color + (25,)
+        # The overlay surface is reused across frames and cleared instead of
+        # reallocated; drawing into it keeps pygame's own clipping of the trail.
+        scanner_surface = self._scanner_surface
+        if scanner_surface is None or scanner_surface.get_size() != self.col2_rect.size:
+            scanner_surface = _convert_for_display(pygame.Surface(self.col2_rect.size, pygame.SRCALPHA))
+            self._scanner_surface = scanner_surface
+        else:
+            scanner_surface.fill((0, 0, 0, 0))
+        trail_color = self._scanner_trail_rgba
         trail_width = 20
         if self._scanner_dir > 0:
             trail_rect = pygame.Rect(self._scanner_pos - trail_width, 0, trail_width, self.col2_rect.height)
@@ -328,20 +469,39 @@ class CameraModule(ScreenModule):
         graph_rect = self.analysis_graph_rect
         color = self.app.current_theme_color
 
-        grid_surface = pygame.Surface(graph_rect.size, pygame.SRCALPHA)
-        cell_size = 10
-        for x in range(0, graph_rect.width, cell_size):
-            pygame.draw.line(grid_surface, color + (100,), (x, 0), (x, graph_rect.height), 1)
-        for y in range(0, graph_rect.height, cell_size):
-            pygame.draw.line(grid_surface, color + (100,), (0, y), (graph_rect.width, y), 1)
-        surface.blit(grid_surface, graph_rect.topleft)
+        key = (graph_rect.size, self._graph_grid_rgba)
+        if key != self._graph_grid_key or self._graph_grid_layer is None:
+            self._graph_grid_layer = self._build_graph_grid_layer(graph_rect.size, self._graph_grid_rgba)
+            self._graph_grid_key = key
+        surface.blit(self._graph_grid_layer, graph_rect.topleft)
         pygame.draw.rect(surface, color, graph_rect, 1)
 
-        points = []
-        for index, value in enumerate(self._graph_data):
-            points.append((graph_rect.x + index, graph_rect.y + value))
-        if len(points) > 1:
+        count = self._graph_len
+        if count > 1:
+            if self._graph_xs_key != (graph_rect.x, graph_rect.width):
+                self._graph_xs = list(range(graph_rect.x, graph_rect.x + graph_rect.width))
+                self._graph_xs_key = (graph_rect.x, graph_rect.width)
+            # Oldest sample first: once the buffer has wrapped it starts at the head.
+            buf = self._graph_buf
+            if count < len(buf):
+                ys = buf[:count] + graph_rect.y
+            else:
+                head = self._graph_head
+                ys = np.concatenate((buf[head:], buf[:head]))
+                ys += graph_rect.y
+            points = list(zip(self._graph_xs[:count], ys.tolist()))
             pygame.draw.lines(surface, color, False, points, 1)
 
+    @staticmethod
+    def _build_graph_grid_layer(size, grid_color) -> pygame.Surface:
+        width, height = size
+        grid_surface = pygame.Surface(size, pygame.SRCALPHA)
+        cell_size = 10
+        for x in range(0, width, cell_size):
+            pygame.draw.line(grid_surface, grid_color, (x, 0), (x, height), 1)
+        for y in range(0, height, cell_size):
+            pygame.draw.line(grid_surface, grid_color, (0, y), (width, y), 1)
+        return _convert_for_display(grid_surface)
+
 
 __all__ = ["CameraModule"]
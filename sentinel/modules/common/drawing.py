@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Tuple
 
 import pygame
@@ -32,16 +33,26 @@ def draw_dashed_line(
         return
 
     dashes = max(1, int(dist / dash_length))
-    for i in range(dashes // 2):
-        start = (
-            x1 + dx * (i * 2) / dashes,
-            y1 + dy * (i * 2) / dashes,
+    for start, end in _dash_steps(dashes):
+        pygame.draw.line(
+            surface,
+            color,
+            (x1 + dx * start / dashes, y1 + dy * start / dashes),
+            (x1 + dx * end / dashes, y1 + dy * end / dashes),
+            width,
         )
-        end = (
-            x1 + dx * (i * 2 + 1) / dashes,
-            y1 + dy * (i * 2 + 1) / dashes,
-        )
-        pygame.draw.line(surface, color, start, end, width)
+
+
+@lru_cache(maxsize=128)
+def _dash_steps(dashes: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the step at which each dash starts and ends, out of ``dashes`` steps.
+
+    Leader lines move every frame, so the table depends only on the dash
+    count. The steps stay integers so endpoints are computed exactly as
+    ``x1 + dx * step / dashes``.
+    """
+
+    return tuple((i * 2, i * 2 + 1) for i in range(dashes // 2))
 
 
 __all__ = ["draw_dashed_line", "draw_diagonal_pattern"]
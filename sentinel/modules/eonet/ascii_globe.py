@@ -1,10 +1,59 @@
 import math
+from functools import lru_cache
 from importlib import resources
 from typing import Optional
 
 import numpy as np
 import pygame
 
+# Tipos de punto: el índice de cada carácter es el valor guardado en ``point_kinds``.
+GLYPHS = ('.', '+')
+GLYPH_ALPHA = (80, 255)
+# El alfa ya está cuantizado a un nivel por tipo, así que la caché sólo crece con los
+# colores del tema; se limita para que un color animado no la haga crecer sin fin.
+GLYPH_CACHE_SIZE = 8
+# pygame-ce añade Surface.fblits, un blits() más rápido que no devuelve rectángulos;
+# con pygame clásico se usa blits(doreturn=False).
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+@lru_cache(maxsize=None)
+def _load_map_points(map_file):
+    """
+    Lee el mapa de texto una sola vez por proceso y devuelve los puntos sobre la
+    esfera unidad junto con su tipo. Los arrays se comparten entre instancias
+    (p. ej. tras un reinicio del módulo), por eso se marcan como de solo lectura.
+    """
+    with open(map_file, 'r') as f:
+        lines = f.readlines()
+
+    map_height = len(lines)
+    map_width = len(lines[0].strip())
+    # Rejilla de caracteres (filas x columnas); las filas cortas se rellenan con espacios.
+    grid = np.array([list(line.rstrip('\n')[:map_width].ljust(map_width)) for line in lines])
+
+    rows, cols = np.indices(grid.shape, dtype=np.float64)
+    lon = np.pi * (cols / (map_width / 2) - 1)
+    lat = np.pi * (0.5 - rows / map_height)
+    cos_lat = np.cos(lat)
+
+    # Se evalúan todas las celdas de una vez y se conservan sólo las de tierra o mar,
+    # en el mismo orden fila a fila que el recorrido original.
+    kind_grid = np.full(grid.shape, -1, dtype=np.int8)
+    for kind, glyph in enumerate(GLYPHS):
+        kind_grid[grid == glyph] = kind
+    mask = kind_grid >= 0
+
+    unit_points = np.stack(
+        [cos_lat[mask] * np.cos(lon[mask]), np.sin(lat[mask]), -cos_lat[mask] * np.sin(lon[mask])],
+        axis=1,
+    )
+    point_kinds = kind_grid[mask].astype(np.uint8)
+    unit_points.flags.writeable = False
+    point_kinds.flags.writeable = False
+    return unit_points, point_kinds
+
+
 class ASCIIGlobe:
     """
     Maneja la creación, rotación y dibujo de un globo terráqueo en ASCII
@@ -21,86 +70,115 @@ class ASCIIGlobe:
         else:
             self.map_file = map_file
         
-        # --- REFACTORIZADO: Una sola lista para todos los puntos ---
-        # Cada elemento será una tupla: (vector_3d, caracter)
-        self.all_points = []
-        self.rotated_points = []
+        # --- Todos los puntos en un único array (N, 3) ---
+        # ``point_kinds`` guarda el tipo (índice en GLYPHS) de cada fila de ``points``.
+        self.points = np.empty((0, 3), dtype=np.float32)
+        self.point_kinds = np.empty(0, dtype=np.uint8)
+        self.rotated_points = np.empty((0, 3), dtype=np.float32)
+        self._rotation = np.eye(3, dtype=np.float32)
         
         # --- Caché para las superficies de los caracteres pre-renderizados ---
-        self.char_surfaces = {}
-        self.last_color = None
+        # Se indexa por (fuente, color) para que los cambios de tema no vuelvan a rasterizar.
+        self._glyph_cache = {}
+        self.char_surfaces = ()
         
         self._generate_points_from_map()
 
     def _generate_points_from_map(self):
         """Genera la esfera de puntos 3D a partir de un mapa de texto."""
         try:
-            with open(self.map_file, 'r') as f:
-                lines = f.readlines()
+            unit_points, kinds = _load_map_points(self.map_file)
         except FileNotFoundError:
             print(f"ERROR: No se encontró el archivo del mapa: {self.map_file}")
             return
 
-        map_height = len(lines)
-        map_width = len(lines[0].strip())
-        self.all_points = []
-        step = 1
-        
-        for r in range(0, map_height, step):
-            for c in range(0, map_width, step):
-                char = lines[r][c]
-                if char == '+' or char == '.':
-                    lon = math.pi * (c / (map_width / 2) - 1)
-                    lat = math.pi * (0.5 - r / map_height)
-                    
-                    x = self.radius * math.cos(lat) * math.cos(lon)
-                    y = self.radius * math.sin(lat)
-                    z = -self.radius * math.cos(lat) * math.sin(lon)
-                    
-                    point_3d = np.array([x, y, z])
-                    
-                    # --- REFACTORIZADO: Añadimos el punto y su carácter a la misma lista ---
-                    self.all_points.append((point_3d, char))
+        # Un único bloque contiguo permite rotar todos los puntos con una sola multiplicación.
+        # float32 basta para coordenadas de pantalla y reduce a la mitad la memoria a recorrer.
+        self.points = (unit_points * self.radius).astype(np.float32)
+        self.point_kinds = kinds
+        # Búferes reutilizados en cada fotograma para evitar reservar memoria al rotar y proyectar.
+        self.rotated_points = np.zeros_like(self.points)
+        self._screen_pos = np.empty((len(self.points), 2), dtype=np.int32)
+        self._visible = np.empty(len(self.points), dtype=bool)
+        self._mask = np.empty(len(self.points), dtype=bool)
+        self._front = np.empty(0, dtype=np.intp)
 
     def update(self, angle_x, angle_y):
         """Rota los puntos del globo usando matrices de rotación."""
-        rotation_y = np.array([
-            [math.cos(angle_y), 0, math.sin(angle_y)],
-            [0, 1, 0],
-            [-math.sin(angle_y), 0, math.cos(angle_y)]
-        ])
-        rotation_x = np.array([
-            [1, 0, 0],
-            [0, math.cos(angle_x), -math.sin(angle_x)],
-            [0, math.sin(angle_x), math.cos(angle_x)]
-        ])
-        
-        self.rotated_points = []
-        for point, char in self.all_points:
-            # --- REFACTORIZADO: Rotamos el punto y lo volvemos a guardar con su carácter ---
-            rotated_p = np.dot(rotation_y, point)
-            rotated_p = np.dot(rotation_x, rotated_p)
-            self.rotated_points.append((rotated_p, char))
+        # El globo normalmente sólo gira sobre Y: en ese caso Rx es la identidad.
+        if abs(angle_x) < 1e-9:
+            cos_x, sin_x = 1.0, 0.0
+        else:
+            cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+        cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+
+        # Producto Rx · Ry desarrollado: una sola matriz y una sola pasada sobre los puntos.
+        # Se escribe sobre la matriz preasignada; el término [0, 1] es siempre 0.
+        rotation = self._rotation
+        rotation[0, 0] = cos_y
+        rotation[0, 2] = sin_y
+        rotation[1, 0] = sin_x * sin_y
+        rotation[1, 1] = cos_x
+        rotation[1, 2] = -sin_x * cos_y
+        rotation[2, 0] = -cos_x * sin_y
+        rotation[2, 1] = sin_x
+        rotation[2, 2] = cos_x * cos_y
+
+        # Rx · (Ry · p) para cada fila equivale a points @ (Rx · Ry)^T.
+        np.dot(self.points, rotation.T, out=self.rotated_points)
+
+        # Índices del hemisferio visible ordenados de atrás hacia delante (orden del pintor).
+        depth = self.rotated_points[:, 2]
+        front = np.flatnonzero(depth > 0)
+        self._front = front[np.argsort(depth[front], kind='stable')]
 
     def draw(self, surface, font, color):
         """Dibuja el globo ASCII en la superficie de Pygame."""
         
-        # Pre-renderiza los caracteres si el color ha cambiado o si no existen
-        if color != self.last_color:
-            self.char_surfaces = {
-                '+': font.render("+", True, color + (255,)),
-                '.': font.render(".", True, color + (80,))
-            }
-            self.last_color = color
-
-        # --- REFACTORIZADO: Un solo bucle para dibujar todos los puntos ---
-        for point, char in self.rotated_points:
-            x, y, z = point[0], point[1], point[2]
-            
-            if z > 0: # Si el punto es visible
-                screen_x = int(x + self.center_x)
-                screen_y = int(self.center_y - y)
-                
-                if 0 <= screen_x < self.screen_width and 0 <= screen_y < self.screen_height:
-                    # Dibuja la superficie pre-renderizada para el carácter correspondiente
-                    surface.blit(self.char_surfaces[char], (screen_x, screen_y))
\ No newline at end of file
+        # Pre-renderiza los caracteres una sola vez por combinación de fuente y color
+        key = (font, tuple(color))
+        char_surfaces = self._glyph_cache.get(key)
+        if char_surfaces is None:
+            char_surfaces = tuple(
+                font.render(glyph, True, key[1] + (alpha,))
+                for glyph, alpha in zip(GLYPHS, GLYPH_ALPHA)
+            )
+            # Convertidos al formato de la pantalla, los blits no reconvierten píxeles en cada
+            # fotograma; convert_alpha() requiere un modo de vídeo ya establecido.
+            if pygame.display.get_surface() is not None:
+                char_surfaces = tuple(glyph.convert_alpha() for glyph in char_surfaces)
+            if len(self._glyph_cache) >= GLYPH_CACHE_SIZE:
+                self._glyph_cache.clear()
+            self._glyph_cache[key] = char_surfaces
+        self.char_surfaces = char_surfaces
+
+        rotated = self.rotated_points
+        if not len(rotated):
+            return
+
+        # Proyección y descarte vectorizados: sólo los puntos visibles llegan al bucle de blit.
+        # Todo se escribe en los búferes preasignados, sin arrays temporales por fotograma.
+        screen_x = self._screen_pos[:, 0]
+        screen_y = self._screen_pos[:, 1]
+        np.add(rotated[:, 0], self.center_x, out=screen_x, casting='unsafe')
+        np.subtract(self.center_y, rotated[:, 1], out=screen_y, casting='unsafe')
+        visible, mask = self._visible, self._mask
+        # Vistos como unsigned, los negativos quedan fuera de rango: una comparación cubre ambos límites.
+        np.less(screen_x.view(np.uint32), self.screen_width, out=visible)
+        np.less(screen_y.view(np.uint32), self.screen_height, out=mask)
+        visible &= mask
+        # El hemisferio oculto ya se descartó en update(); aquí sólo se recorren los puntos frontales.
+        front = self._front
+        indices = front[visible[front]]
+
+        # Una única llamada recorre la secuencia dentro de SDL en lugar de un blit() por punto.
+        # Se mantiene una sola secuencia (no una por carácter) para respetar el orden del pintor.
+        kinds = self.point_kinds[indices].tolist()
+        sequence = [
+            (char_surfaces[kind], (x, y))
+            for kind, x, y in zip(kinds, screen_x[indices].tolist(), screen_y[indices].tolist())
+        ]
+        if _HAS_FBLITS:
+            surface.fblits(sequence)
+        else:
+            surface.blits(sequence, doreturn=False)
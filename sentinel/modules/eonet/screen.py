@@ -47,6 +47,8 @@ class EONETGlobeModule(ScreenModule):
             self.app.header_title_text = "S.E.N.T.I.N.E.L. // EONET"
 
     def on_unload(self) -> None:
+        if self._tracker is not None:
+            self._tracker.stop_periodic_fetch()
         self._ascii_globe = None
         self._tracker = None
 
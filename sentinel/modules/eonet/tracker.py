@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import threading
-from typing import List
+from typing import List, Optional
 
 import requests
 
@@ -15,6 +15,10 @@ class EONETTracker:
         self.base_url = "https://eonet.gsfc.nasa.gov/api/v3/events"
         self.events: List[dict] = []
         self.data_lock = threading.Lock()
+        # Reuse one HTTP connection pool (and its TLS session) across refreshes.
+        self.session = requests.Session()
+        self._fetch_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def fetch_data(self) -> None:
         """Fetch the 20 most recent events from the NASA feed."""
@@ -24,7 +28,7 @@ class EONETTracker:
         }
         print("INFO: Fetching EONET data from NASA API...")
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -59,12 +63,36 @@ class EONETTracker:
             return list(self.events)
 
     def start_periodic_fetch(self, interval_hours: float = 1) -> None:
-        """Schedule regular refreshes of the NASA feed."""
-
+        """Fetch the NASA feed in the background and schedule regular refreshes."""
+
+        if self._fetch_thread and self._fetch_thread.is_alive():
+            return
+        # A fresh event per loop so a stopped loop can never be revived by a restart.
+        self._stop_event = threading.Event()
+        self._fetch_thread = threading.Thread(
+            target=self._run_periodic_fetch,
+            args=(interval_hours * 3600, self._stop_event),
+            name="EONETTracker",
+            daemon=True,
+        )
+        self._fetch_thread.start()
+
+    def stop_periodic_fetch(self) -> None:
+        """Stop the background refresh loop and release the pooled HTTP connections."""
+
+        self._stop_event.set()
+        thread = self._fetch_thread
+        self._fetch_thread = None
+        if thread is not None and thread is not threading.current_thread():
+            # An idle loop wakes at once; a refresh in flight is given a moment but is
+            # not waited out, and its connection is dropped when it completes.
+            thread.join(timeout=1.0)
+        self.session.close()
+
+    def _run_periodic_fetch(self, interval_seconds: float, stop_event: threading.Event) -> None:
         self.fetch_data()
-        fetch_timer = threading.Timer(interval_hours * 3600, self.start_periodic_fetch, [interval_hours])
-        fetch_timer.daemon = True
-        fetch_timer.start()
+        while not stop_event.wait(interval_seconds):
+            self.fetch_data()
 
 
 __all__ = ["EONETTracker"]
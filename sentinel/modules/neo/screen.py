@@ -33,6 +33,11 @@ class NeoTrackerModule(ScreenModule):
         self.neo_tracker = NEOTracker(api_key)
         self.neo_tracker.start_periodic_fetch(interval_hours=6)
 
+    def on_unload(self) -> None:
+        if self.neo_tracker is not None:
+            self.neo_tracker.stop_periodic_fetch()
+        self.neo_tracker = None
+
     def on_show(self) -> None:
         if self.app:
             self.app.header_title_text = "S.E.N.T.I.N.E.L. // DEEP SPACE"
@@ -6,6 +6,7 @@ import threading
 from datetime import date, timedelta
 from typing import Optional
 
+import numpy as np
 import requests
 
 
@@ -17,6 +18,10 @@ class NEOTracker:
         self.base_url = "https://api.nasa.gov/neo/rest/v1/feed"
         self.closest_neo: Optional[dict] = None
         self.data_lock = threading.Lock()
+        # Reuse one HTTP connection pool (and its TLS session) across refreshes.
+        self.session = requests.Session()
+        self._fetch_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def fetch_data(self) -> None:
         """Retrieve objects for the next week and cache the closest NEO."""
@@ -30,7 +35,7 @@ class NEOTracker:
         }
         print("INFO: Fetching NEO data from NASA API...")
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -42,10 +47,12 @@ class NEOTracker:
                 print("WARNING: No NEOs found in the coming week.")
                 return
 
-            closest = min(
-                all_neos,
-                key=lambda neo: float(neo["close_approach_data"][0]["miss_distance"]["kilometers"]),
+            miss_distances = np.fromiter(
+                (float(neo["close_approach_data"][0]["miss_distance"]["kilometers"]) for neo in all_neos),
+                dtype=np.float64,
+                count=len(all_neos),
             )
+            closest = all_neos[int(np.argmin(miss_distances))]
             approach_info = closest["close_approach_data"][0]
 
             with self.data_lock:
@@ -79,12 +86,36 @@ class NEOTracker:
             return dict(self.closest_neo) if self.closest_neo else None
 
     def start_periodic_fetch(self, interval_hours: float = 6) -> None:
-        """Schedule periodic refreshes of the NEO feed."""
-
+        """Fetch the NEO feed in the background and schedule periodic refreshes."""
+
+        if self._fetch_thread and self._fetch_thread.is_alive():
+            return
+        # A fresh event per loop so a stopped loop can never be revived by a restart.
+        self._stop_event = threading.Event()
+        self._fetch_thread = threading.Thread(
+            target=self._run_periodic_fetch,
+            args=(interval_hours * 3600, self._stop_event),
+            name="NEOTracker",
+            daemon=True,
+        )
+        self._fetch_thread.start()
+
+    def stop_periodic_fetch(self) -> None:
+        """Stop the background refresh loop and release the pooled HTTP connections."""
+
+        self._stop_event.set()
+        thread = self._fetch_thread
+        self._fetch_thread = None
+        if thread is not None and thread is not threading.current_thread():
+            # An idle loop wakes at once; a refresh in flight is given a moment but is
+            # not waited out, and its connection is dropped when it completes.
+            thread.join(timeout=1.0)
+        self.session.close()
+
+    def _run_periodic_fetch(self, interval_seconds: float, stop_event: threading.Event) -> None:
         self.fetch_data()
-        fetch_timer = threading.Timer(interval_hours * 3600, self.start_periodic_fetch, [interval_hours])
-        fetch_timer.daemon = True
-        fetch_timer.start()
+        while not stop_event.wait(interval_seconds):
+            self.fetch_data()
 
 
 __all__ = ["NEOTracker"]
@@ -0,0 +1,58 @@
+"""Tests for detection ingest in the camera controller."""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("pygame")
+pytest.importorskip("requests")
+
+# The camera package imports the user's config.py (copied from config.py.example);
+# the controller reads everything from the mapping it is given, so an empty one will do.
+if "config" not in sys.modules:
+    try:
+        import config  # noqa: F401
+    except ModuleNotFoundError:
+        sys.modules["config"] = types.SimpleNamespace(CONFIG={}, THEME_COLORS={})
+
+from sentinel.modules.camera.controller import CameraController
+
+
+@pytest.fixture
+def controller():
+    instance = CameraController({"camera_name": "front", "bbox_delay": -1})
+    yield instance
+    instance.close()
+
+
+def test_ingest_leaves_the_published_payload_untouched(controller):
+    after = {"camera": "front", "id": "abc", "label": "person", "score": 0.9, "entered_zones": ["porch"]}
+    controller.queue_detection({"type": "new", "after": after})
+
+    controller._process_detection_buffer()
+
+    assert after == {"camera": "front", "id": "abc", "label": "person", "score": 0.9, "entered_zones": ["porch"]}
+    record = controller.active_detections["abc"]
+    assert record is not after
+    assert record["entered_zones"] == ("porch",)
+
+
+def test_end_event_removes_the_detection(controller):
+    controller.queue_detection({"type": "new", "after": {"camera": "front", "id": "abc", "label": "car"}})
+    controller.queue_detection({"type": "end", "after": {"camera": "front", "id": "abc"}})
+
+    controller._process_detection_buffer()
+
+    assert "abc" not in controller.active_detections
+
+
+def test_other_cameras_are_ignored(controller):
+    controller.queue_detection({"type": "new", "after": {"camera": "back", "id": "abc", "label": "car"}})
+
+    controller._process_detection_buffer()
+
+    assert not controller.active_detections
@@ -0,0 +1,114 @@
+"""Tests for the parsed YAML cache in the configuration loader."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from sentinel.config import loader
+
+
+@pytest.fixture
+def parse_calls(tmp_path, monkeypatch):
+    """Isolate the cache under ``tmp_path`` and count real YAML parses."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(loader, "_PARSED_YAML", {})
+    calls = []
+    parse = loader._parse_yaml
+
+    def counting_parse(path):
+        calls.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(loader, "_parse_yaml", counting_parse)
+    return calls
+
+
+def write(path, text, *, mtime_ns=None):
+    path.write_text(text, encoding="utf8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_repeated_loads_parse_once_and_return_fresh_copies(tmp_path, parse_calls):
+    path = tmp_path / "core.yaml"
+    write(path, "fps: 30\nmargins: {top: 10}\n")
+
+    first = loader._load_yaml(path)
+    first["margins"]["top"] = 99
+    second = loader._load_yaml(path)
+
+    assert second == {"fps": 30, "margins": {"top": 10}}
+    assert len(parse_calls) == 1
+
+
+def test_mtime_change_triggers_a_reparse(tmp_path, parse_calls):
+    path = tmp_path / "core.yaml"
+    write(path, "fps: 30\n", mtime_ns=1_000_000_000)
+    assert loader._load_yaml(path) == {"fps": 30}
+
+    # Same size, different content: only the modification time tells them apart.
+    write(path, "fps: 60\n", mtime_ns=2_000_000_000)
+    assert loader._load_yaml(path) == {"fps": 60}
+    assert len(parse_calls) == 2
+
+
+def test_size_change_triggers_a_reparse(tmp_path, parse_calls):
+    path = tmp_path / "core.yaml"
+    write(path, "fps: 30\n", mtime_ns=1_000_000_000)
+    assert loader._load_yaml(path) == {"fps": 30}
+
+    write(path, "fps: 120\n", mtime_ns=1_000_000_000)
+    assert loader._load_yaml(path) == {"fps": 120}
+    assert len(parse_calls) == 2
+
+
+def test_disk_cache_is_reused_across_processes_and_replaced_on_edit(tmp_path, parse_calls, monkeypatch):
+    path = tmp_path / "core.yaml"
+    write(path, "fps: 30\n", mtime_ns=1_000_000_000)
+    loader._load_yaml(path)
+
+    # A new process starts with an empty in-memory cache.
+    monkeypatch.setattr(loader, "_PARSED_YAML", {})
+    assert loader._load_yaml(path) == {"fps": 30}
+    assert len(parse_calls) == 1
+
+    write(path, "fps: 60\n", mtime_ns=2_000_000_000)
+    monkeypatch.setattr(loader, "_PARSED_YAML", {})
+    assert loader._load_yaml(path) == {"fps": 60}
+    assert len(parse_calls) == 2
+    cache_files = list((tmp_path / "cache" / "sentinel" / "yaml").iterdir())
+    assert [entry.suffix for entry in cache_files] == [".json"]
+
+
+def test_unreadable_disk_entry_falls_back_to_parsing(tmp_path, parse_calls, monkeypatch):
+    path = tmp_path / "core.yaml"
+    write(path, "fps: 30\n")
+    loader._load_yaml(path)
+    cache_file = loader._yaml_cache_file(os.path.abspath(path))
+    cache_file.write_text("not json", encoding="utf8")
+
+    monkeypatch.setattr(loader, "_PARSED_YAML", {})
+    assert loader._load_yaml(path) == {"fps": 30}
+    assert len(parse_calls) == 2
+    assert json.loads(cache_file.read_text(encoding="utf8"))[2] == {"fps": 30}
+
+
+def test_documents_json_cannot_represent_stay_in_memory(tmp_path, parse_calls):
+    path = tmp_path / "core.yaml"
+    write(path, "started: 2024-01-01\n1: one\n")
+
+    first = loader._load_yaml(path)
+    assert loader._load_yaml(path) == first
+    assert 1 in first
+    assert len(parse_calls) == 1
+    assert not (tmp_path / "cache" / "sentinel" / "yaml").exists()
+
+
+def test_missing_file_yields_empty_mapping(tmp_path, parse_calls):
+    assert loader._load_yaml(tmp_path / "missing.yaml") == {}
+    assert not parse_calls
@@ -0,0 +1,190 @@
+"""Tests for state expiry, ranking and resolution in the module manager."""
+
+from __future__ import annotations
+
+import time
+
+from sentinel.core.module import ScreenModule
+from sentinel.core.module_manager import ModuleManager
+
+
+class DummyModule(ScreenModule):
+    def __init__(self, config=None) -> None:
+        super().__init__(config)
+        self.shows = 0
+
+    def on_show(self) -> None:
+        self.shows += 1
+
+    def render(self, surface) -> None:
+        pass
+
+
+class DummyApp:
+    current_screen = None
+
+
+def make_manager(rules, **priorities):
+    modules = {"camera": DummyModule(), "radar": DummyModule()}
+    manager = ModuleManager(DummyApp(), modules, priorities={"rules": rules, **priorities})
+    return manager, modules
+
+
+def rule(module, weight, state=None, **extra):
+    when = {"module": module}
+    if state is not None:
+        when["state"] = state
+    return {"when": when, "weight": weight, **extra}
+
+
+# ---------------------------------------------------------------------- expiry
+def test_expired_state_is_dropped_without_stale_decay():
+    manager, _ = make_manager([rule("camera", 100, "danger")], timeout_seconds=1)
+    manager.report_state("camera", "danger")
+    now = time.monotonic()
+
+    manager._expire_states(now + 0.5)
+    assert manager._active_weights["camera"] == (-100, 0, "camera")
+
+    manager._expire_states(now + 1.5)
+    assert "camera" not in manager._states
+    assert "camera" not in manager._active_weights
+
+
+def test_stale_decay_keeps_expired_state_for_one_more_timeout():
+    manager, _ = make_manager([rule("camera", 100, "danger", stale_decay=0.5)], timeout_seconds=1)
+    manager.report_state("camera", "danger")
+    now = time.monotonic()
+
+    manager._expire_states(now + 1.5)
+    assert manager._states["camera"].stale
+    assert manager._active_weights["camera"] == (-50.0, 0, "camera")
+
+    manager._expire_states(now + 2.5)
+    assert "camera" not in manager._states
+    assert "camera" not in manager._active_weights
+
+
+def test_stale_state_only_matches_rules_with_stale_decay():
+    rules = [rule("camera", 100, "danger"), rule("camera", 40, "danger", stale_decay=1.0, screen="radar")]
+    manager, _ = make_manager(rules, timeout_seconds=1)
+    manager.report_state("camera", "danger")
+    assert manager._active_weights["camera"] == (-100, 0, "camera")
+
+    manager._expire_states(time.monotonic() + 1.5)
+    assert manager._active_weights["camera"] == (-40.0, 1, "radar")
+
+
+def test_next_expiry_tracks_earliest_deadline():
+    manager, _ = make_manager([rule("camera", 100), rule("radar", 50)], timeout_seconds=10)
+    manager.report_state("camera", "danger", expires_in=2)
+    manager.report_state("radar", "air-traffic", expires_in=5)
+    now = time.monotonic()
+
+    manager._expire_states(now + 3)
+    assert "camera" not in manager._states
+    assert manager._next_expiry == manager._states["radar"].expires_at
+
+
+# --------------------------------------------------------------------- ranking
+def test_rank_state_prefers_highest_weight_then_earliest_rule():
+    rules = [rule("camera", 50, screen="radar"), rule("camera", 80, "danger"), rule("camera", 80, screen="radar")]
+    manager, _ = make_manager(rules)
+
+    manager.report_state("camera", "danger")
+    assert manager._active_weights["camera"] == (-80, 1, "camera")
+
+    manager.report_state("camera", "idle")
+    assert manager._active_weights["camera"] == (-80, 2, "radar")
+
+
+def test_rank_state_uses_weight_override():
+    manager, _ = make_manager([rule("camera", 100)])
+    manager.report_state("camera", "danger", weight=5)
+    assert manager._active_weights["camera"] == (-5, 0, "camera")
+
+
+def test_rank_state_drops_module_without_matching_rule():
+    manager, _ = make_manager([rule("camera", 100, "danger")])
+    manager.report_state("camera", "danger")
+    manager.report_state("camera", "idle")
+    assert "camera" not in manager._active_weights
+
+
+def test_unchanged_reports_reuse_the_resolved_screen():
+    manager, modules = make_manager([rule("camera", 100, "danger"), rule("radar", 50)])
+    modules["radar"].report_state("air-traffic")
+    manager.update(1 / 30)
+    assert manager.current_screen == "radar"
+
+    for _ in range(10):
+        modules["camera"].report_state(None)
+        modules["radar"].report_state("air-traffic")
+        assert not manager._resolution_dirty
+        manager.update(1 / 30)
+    assert len(manager._weight_heap) == 1
+
+    modules["camera"].report_state("danger")
+    assert manager._resolution_dirty
+    manager.update(1 / 30)
+    assert manager.current_screen == "camera"
+
+    modules["camera"].report_state(None)
+    manager.update(1 / 30)
+    assert manager.current_screen == "radar"
+
+
+# ----------------------------------------------------------------------- aging
+def test_aging_switches_on_a_time_basis_and_holds_for_one_dwell():
+    rules = [rule("camera", 100), rule("radar", 95)]
+    manager, modules = make_manager(rules, idle={"dwell_seconds": 20}, aging={"scale": 1, "cap": 8})
+    switches = []
+    for frame in range(30 * 60):
+        manager.report_state("camera", "danger")
+        manager.report_state("radar", "air-traffic")
+        manager.update(1 / 30)
+        if not switches or switches[-1][1] != manager.current_screen:
+            switches.append((frame, manager.current_screen))
+
+    assert [screen for _, screen in switches] == ["camera", "radar", "camera"]
+    assert all(later - earlier >= 30 * 20 for (earlier, _), (later, _) in zip(switches, switches[1:]))
+
+
+def test_aged_winner_yields_to_a_real_priority_change():
+    rules = [rule("camera", 100, "danger"), rule("camera", 300, "alert"), rule("radar", 95)]
+    manager, _ = make_manager(rules, idle={"dwell_seconds": 20}, aging={"scale": 1, "cap": 8})
+    manager.report_state("camera", "danger")
+    manager.report_state("radar", "air-traffic")
+    manager.update(1 / 30)
+    assert manager.current_screen == "camera"
+
+    manager.report_state("camera", "alert")
+    manager.update(1 / 30)
+    assert manager.current_screen == "camera"
+    manager.report_state("camera", "danger")
+    for _ in range(30 * 21):
+        manager.update(1 / 30)
+    assert manager.current_screen == "radar"
+
+    manager.report_state("camera", "alert")
+    manager.update(1 / 30)
+    assert manager.current_screen == "camera"
+
+
+# -------------------------------------------------------------------- shutdown
+def test_shutdown_continues_after_unbind_error():
+    class FailingModule(DummyModule):
+        def unbind(self) -> None:
+            raise RuntimeError("boom")
+
+    modules = {"camera": FailingModule(), "radar": DummyModule()}
+    manager = ModuleManager(DummyApp(), modules, priorities={"rules": [rule("radar", 10)]})
+    manager.report_state("radar", "air-traffic")
+    manager.set_active("radar")
+
+    manager.shutdown()
+
+    assert modules["radar"].manager is None
+    assert not manager.modules
+    assert not manager._active_weights
+    assert manager.current_screen is None